@@ -218,6 +218,7 @@ SUPPORTED_DASH_STYLE_VALUES = [
     'ShortDot',
     'Solid'
 ]
+_DASH_STYLE_SET = frozenset(SUPPORTED_DASH_STYLE_VALUES)
 
 ## ACCESSIBILITY DEFAULTS
 DEFAULT_LANDMARK_VERBOSITY = 'all'
@@ -786,6 +787,12 @@ DEFAULT_LEGEND = {
     'x': 0,
     'y': 0
 }
+LEGEND_ALIGN_VALUES = frozenset(['left', 'center', 'right'])
+LEGEND_LAYOUT_VALUES = frozenset(['horizontal', 'vertical', 'proximate'])
+LEGEND_VERTICAL_ALIGN_VALUES = frozenset(['top', 'middle', 'bottom'])
+LAYOUT_STARTING_DIRECTION_VALUES = frozenset(['vertical', 'horizontal'])
+STACKING_VALUES = frozenset(['normal', 'percent', 'stream', 'overlap'])
+LINK_COLOR_MODE_VALUES = frozenset(['from', 'gradient', 'to'])
 DEFAULT_BUBBLE_LEGEND = {
     'border_color': None,
     'border_width': 2,
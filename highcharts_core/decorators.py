@@ -8,6 +8,37 @@ from validator_collection import checkers
 from highcharts_core import errors, constants
 
 
+def _resolve_types(types):
+    """Return ``types`` as a :class:`list <python:list>` of
+    :class:`type <python:type>` objects.
+
+    :param types: :class:`type <python:type>` object or iterable of
+      :class:`type <python:type>` objects.
+
+    :rtype: :class:`list <python:list>` of :class:`type <python:type>`
+
+    :raises HighchartsImplementationError: if ``types`` is empty
+
+    :raises HighchartsValueError: if ``types`` does not contain a
+      :class:`type <python:type>` or iterable of :class:`type <python:type>` objects
+    """
+    if not types:
+        raise errors.HighchartsImplementationError('types cannot be empty - must be a type or '
+                                         'iterable of types')
+
+    try:
+        types_list = [x for x in types]
+    except TypeError:
+        types_list = [types]
+
+    for item in types_list:
+        if not isinstance(item, type):
+            raise errors.HighchartsValueError(f'types must contain one or more type '
+                                              f'objects. Received a {type(item)}.')
+
+    return types_list
+
+
 def validate_types(value,
                    types = None,
                    allow_dict = True,
@@ -66,24 +97,7 @@ def validate_types(value,
       :class:`HighchartsMeta` interface definition
 
     """
-    if not types:
-        raise errors.HighchartsImplementationError('types cannot be empty - must be a type or '
-                                         'iterable of types')
-
-    if not types:
-        raise errors.HighchartsImplementationError('types cannot be empty - must be a type or '
-                                         'iterable of types')
-
-    try:
-        types_list = [x for x in types]
-    except TypeError:
-        types_list = [types]
-
-    for item in types_list:
-        if not isinstance(item, type):
-            raise errors.HighchartsValueError(f'types must contain one or more type '
-                                              f'objects. Received a {type(item)}.')
-
+    types_list = _resolve_types(types)
     primary_type = types_list[0]
     if not hasattr(primary_type, 'from_js_literal'):
         allow_js_literal = False
@@ -245,6 +259,10 @@ def class_sensitive(types = None,
       :class:`HighchartsMeta` interface definition
 
     """
+    # Resolved up front so that a misconfigured decorator fails when it is applied,
+    # rather than only once the None short-circuit below is bypassed.
+    primary_type = _resolve_types(types)[0]
+
     def decorator(func):
         @wraps(func)
         def func_wrapper(*args,
@@ -257,6 +275,17 @@ def class_sensitive(types = None,
                 raise errors.HighchartsError('Something went wrong. Unsure how this '
                                              'might happen.')
 
+            # Values that validate_types() would return unchanged skip the full check.
+            if value is None and allow_none:
+                return func(args[0], None)
+            if (
+                not force_iterable and
+                type(value) is primary_type and
+                not isinstance(value, (str, bytes, dict)) and
+                value
+            ):
+                return func(args[0], value)
+
             value = validate_types(value,
                                    types = types,
                                    allow_dict = allow_dict,
@@ -32,7 +32,16 @@ from highcharts_core.js_literal_functions import serialize_to_js_literal, assemb
 
 class HighchartsMeta(ABC):
     """Metaclass that is used to define the standard interface exposed for serializable
-    objects."""
+    objects.
+
+    .. note::
+
+      Subclasses may declare a ``_KEY_MAP`` tuple of ``(Python attribute, JavaScript
+      key)`` pairs for the options they add. Methods always read it as
+      ``ClassName._KEY_MAP`` rather than through ``cls`` or ``self``, so that in a
+      multiple-inheritance chain (e.g. a series composed with its plot options) each
+      class only ever sees its own options.
+    """
 
     def __init__(self, **kwargs):
         for key in kwargs:
@@ -232,7 +241,7 @@ class HighchartsMeta(ABC):
 
         trimmed = []
         for item in untrimmed:
-            if checkers.is_type(item, 'CallbackFunction') and to_json:
+            if to_json and checkers.is_type(item, 'CallbackFunction'):
                 continue
             elif item is None or item == constants.EnforcedNull:
                 if to_json:
@@ -296,11 +305,16 @@ class HighchartsMeta(ABC):
         :rtype: :class:`dict <python:dict>`
         """
         as_dict = {}
-        for key in untrimmed:
-            context_key = f'{context}.{key}'
-            value = untrimmed.get(key, None)
+        for key, value in untrimmed.items():
+            # None -> omitted, unless the context explicitly allows it
+            if value is None:
+                if to_json and f'{context}.{key}' in constants.ALLOWED_NONE_CONTEXTS:
+                    as_dict[key] = None
             # bool -> Boolean
-            if isinstance(value, bool):
+            elif isinstance(value, bool):
+                as_dict[key] = value
+            # int / float -> number (checked before the costlier type checks below)
+            elif type(value) is int or type(value) is float:
                 as_dict[key] = value
             # ndarray -> (for json) -> list
             elif HAS_NUMPY and to_json and isinstance(value, np.ndarray):
@@ -316,7 +330,7 @@ class HighchartsMeta(ABC):
             elif HAS_NUMPY and isinstance(value, np.ndarray):
                 as_dict[key] = value
             # Callback Function
-            elif checkers.is_type(value, 'CallbackFunction') and to_json:
+            elif to_json and checkers.is_type(value, 'CallbackFunction'):
                 if not for_export:
                     continue
                 elif value:
@@ -324,7 +338,7 @@ class HighchartsMeta(ABC):
                     if trimmed_value and trimmed_value != 'None':
                         as_dict[key] = trimmed_value
             # MapData -> dict --> object
-            elif checkers.is_type(value, 'MapData') and to_json and for_export:
+            elif to_json and for_export and checkers.is_type(value, 'MapData'):
                 untrimmed_value = value._to_untrimmed_dict()
                 updated_context = value.__class__.__name__
                 topology = untrimmed_value.get('topology', None)
@@ -403,11 +417,8 @@ class HighchartsMeta(ABC):
             elif value in [0, 0., False]:
                 as_dict[key] = value
             # other falsy -> str, but empty string is allowed
-            elif value == '' and context_key in constants.EMPTY_STRING_CONTEXTS:
+            elif value == '' and f'{context}.{key}' in constants.EMPTY_STRING_CONTEXTS:
                 as_dict[key] = ''
-            elif value is None and context_key in constants.ALLOWED_NONE_CONTEXTS:
-                if to_json:
-                    as_dict[key] = None
 
         return as_dict
 
@@ -984,7 +995,7 @@ class JavaScriptDict(UserDict):
 
         trimmed = []
         for item in untrimmed:
-            if checkers.is_type(item, 'CallbackFunction') and to_json:
+            if to_json and checkers.is_type(item, 'CallbackFunction'):
                 continue
             elif item is None or item == constants.EnforcedNull:
                 trimmed.append('null')
@@ -1043,14 +1054,19 @@ class JavaScriptDict(UserDict):
         :rtype: :class:`dict <python:dict>`
         """
         as_dict = {}
-        for key in untrimmed:
-            context_key = f'{context}.{key}'
-            value = untrimmed.get(key, None)
+        for key, value in untrimmed.items():
+            # None -> omitted, unless the context explicitly allows it
+            if value is None:
+                if to_json and f'{context}.{key}' in constants.ALLOWED_NONE_CONTEXTS:
+                    as_dict[key] = None
             # bool -> Boolean
-            if isinstance(value, bool):
+            elif isinstance(value, bool):
+                as_dict[key] = value
+            # int / float -> number (checked before the costlier type checks below)
+            elif type(value) is int or type(value) is float:
                 as_dict[key] = value
             # Callback Function
-            elif checkers.is_type(value, 'CallbackFunction') and to_json:
+            elif to_json and checkers.is_type(value, 'CallbackFunction'):
                 continue
             # HighchartsMeta -> dict --> object
             elif value and hasattr(value, '_to_untrimmed_dict'):
@@ -1120,11 +1136,8 @@ class JavaScriptDict(UserDict):
             elif value in [0, 0., False]:
                 as_dict[key] = value
             # other falsy -> str, but empty string is allowed
-            elif value == '' and context_key in constants.EMPTY_STRING_CONTEXTS:
+            elif value == '' and f'{context}.{key}' in constants.EMPTY_STRING_CONTEXTS:
                 as_dict[key] = ''
-            elif value is None and context_key in constants.ALLOWED_NONE_CONTEXTS:
-                if to_json:
-                    as_dict[key] = None
 
         return as_dict
 
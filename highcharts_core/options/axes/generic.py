@@ -309,7 +309,7 @@ class GenericAxis(HighchartsMeta):
             self._grid_line_dash_style = None
         else:
             value = validators.string(value)
-            if value not in constants.SUPPORTED_DASH_STYLE_VALUES:
+            if value not in constants._DASH_STYLE_SET:
                 raise errors.HighchartsValueError(f'grid_line_dash_style expects a '
                                                   f'recognized value, but received: '
                                                   f'{value}')
@@ -556,7 +556,7 @@ class GenericAxis(HighchartsMeta):
             self._minor_grid_line_dash_style = None
         else:
             value = validators.string(value)
-            if value not in constants.SUPPORTED_DASH_STYLE_VALUES:
+            if value not in constants._DASH_STYLE_SET:
                 raise errors.HighchartsValueError(f'minor_grid_line_dash_style expects a '
                                                   f'recognized value, but received: '
                                                   f'{value}')
@@ -306,7 +306,7 @@ class PlotLine(HighchartsMeta):
             self._dash_style = None
         else:
             value = validators.string(value)
-            if value not in constants.SUPPORTED_DASH_STYLE_VALUES:
+            if value not in constants._DASH_STYLE_SET:
                 raise errors.HighchartsValueError(f'dash_style expects a '
                                                   f'recognized value, but received: '
                                                   f'{value}')
@@ -434,8 +434,6 @@ class YAxis(XAxis):
             'tooltipValueFormat': self.tooltip_value_format
         }
 
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls)
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls))
 
         return untrimmed
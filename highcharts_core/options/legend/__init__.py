@@ -3,7 +3,7 @@ from decimal import Decimal
 
 from validator_collection import validators
 
-from highcharts_core import constants, errors
+from highcharts_core import constants, errors, utility_functions
 from highcharts_core.decorators import class_sensitive, validate_types
 from highcharts_core.metaclasses import HighchartsMeta
 from highcharts_core.options.legend.accessibility import LegendAccessibilityOptions
@@ -28,88 +28,58 @@ class Legend(HighchartsMeta):
 
     """
 
+    _KEY_MAP = (
+        ('accessibility', 'accessibility'),
+        ('align', 'align'),
+        ('align_columns', 'alignColumns'),
+        ('background_color', 'backgroundColor'),
+        ('border_color', 'borderColor'),
+        ('border_width', 'borderWidth'),
+        ('border_radius', 'borderRadius'),
+        ('bubble_legend', 'bubbleLegend'),
+        ('class_name', 'className'),
+        ('enabled', 'enabled'),
+        ('floating', 'floating'),
+        ('item_checkbox_style', 'itemCheckboxStyle'),
+        ('item_distance', 'itemDistance'),
+        ('item_hidden_style', 'itemHiddenStyle'),
+        ('item_hover_style', 'itemHoverStyle'),
+        ('item_margin_bottom', 'itemMarginBottom'),
+        ('item_margin_top', 'itemMarginTop'),
+        ('item_style', 'itemStyle'),
+        ('item_width', 'itemWidth'),
+        ('label_format', 'labelFormat'),
+        ('label_formatter', 'labelFormatter'),
+        ('layout', 'layout'),
+        ('margin', 'margin'),
+        ('max_height', 'maxHeight'),
+        ('navigation', 'navigation'),
+        ('padding', 'padding'),
+        ('reversed', 'reversed'),
+        ('rtl', 'rtl'),
+        ('shadow', 'shadow'),
+        ('square_symbol', 'squareSymbol'),
+        ('symbol_height', 'symbolHeight'),
+        ('symbol_padding', 'symbolPadding'),
+        ('symbol_radius', 'symbolRadius'),
+        ('symbol_width', 'symbolWidth'),
+        ('title', 'title'),
+        ('use_html', 'useHTML'),
+        ('vertical_align', 'verticalAlign'),
+        ('width', 'width'),
+        ('x', 'x'),
+        ('y', 'y'),
+    )
+    _DEFAULTS = dict.fromkeys('_' + name for name, _ in _KEY_MAP)
+
     def __init__(self, **kwargs):
-        self._accessibility = None
-        self._align = None
-        self._align_columns = None
-        self._background_color = None
-        self._border_color = None
-        self._border_width = None
-        self._border_radius = None
-        self._bubble_legend = None
-        self._class_name = None
-        self._enabled = None
-        self._floating = None
-        self._item_checkbox_style = None
-        self._item_distance = None
-        self._item_hidden_style = None
-        self._item_hover_style = None
-        self._item_margin_bottom = None
-        self._item_margin_top = None
-        self._item_style = None
-        self._item_width = None
-        self._label_format = None
-        self._label_formatter = None
-        self._layout = None
-        self._margin = None
-        self._max_height = None
-        self._navigation = None
-        self._padding = None
-        self._reversed = None
-        self._rtl = None
-        self._shadow = None
-        self._square_symbol = None
-        self._symbol_height = None
-        self._symbol_padding = None
-        self._symbol_radius = None
-        self._symbol_width = None
-        self._title = None
-        self._use_html = None
-        self._vertical_align = None
-        self._width = None
-        self._x = None
-        self._y = None
-
-        self.accessibility = kwargs.get('accessibility', None)
-        self.align = kwargs.get('align', None)
-        self.align_columns = kwargs.get('align_columns', None)
-        self.background_color = kwargs.get('background_color', None)
-        self.border_color = kwargs.get('border_color', None)
-        self.border_width = kwargs.get('border_width', None)
-        self.border_radius = kwargs.get('border_radius', None)
-        self.bubble_legend = kwargs.get('bubble_legend', None)
-        self.class_name = kwargs.get('class_name', None)
-        self.enabled = kwargs.get('enabled', None)
-        self.floating = kwargs.get('floating', None)
-        self.item_checkbox_style = kwargs.get('item_checkbox_style', None)
-        self.item_distance = kwargs.get('item_distance', None)
-        self.item_hidden_style = kwargs.get('item_hidden_style', None)
-        self.item_hover_style = kwargs.get('item_hover_style', None)
-        self.item_margin_bottom = kwargs.get('item_margin_bottom', None)
-        self.item_margin_top = kwargs.get('item_margin_top', None)
-        self.item_style = kwargs.get('item_style', None)
-        self.item_width = kwargs.get('item_width', None)
-        self.label_format = kwargs.get('label_format', None)
-        self.label_formatter = kwargs.get('label_formatter', None)
-        self.layout = kwargs.get('layout', None)
-        self.margin = kwargs.get('margin', None)
-        self.max_height = kwargs.get('max_height', None)
-        self.navigation = kwargs.get('navigation', None)
-        self.padding = kwargs.get('padding', None)
-        self.reversed = kwargs.get('reversed', None)
-        self.rtl = kwargs.get('rtl', None)
-        self.shadow = kwargs.get('shadow', None)
-        self.square_symbol = kwargs.get('square_symbol', None)
-        self.symbol_height = kwargs.get('symbol_height', None)
-        self.symbol_padding = kwargs.get('symbol_padding', None)
-        self.symbol_radius = kwargs.get('symbol_radius', None)
-        self.symbol_width = kwargs.get('symbol_width', None)
-        self.title = kwargs.get('title', None)
-        self.use_html = kwargs.get('use_html', None)
-        self.vertical_align = kwargs.get('vertical_align', None)
-        self.width = kwargs.get('width', None)
-        self.x = kwargs.get('x', None)
-        self.y = kwargs.get('y', None)
+        self.__dict__.update(Legend._DEFAULTS)
+
+        get_kwarg = kwargs.get
+        for name, _ in Legend._KEY_MAP:
+            value = get_kwarg(name)
+            if value is not None:
+                setattr(self, name, value)
 
     @property
     def _dot_path(self) -> Optional[str]:
@@ -157,15 +127,9 @@ class Legend(HighchartsMeta):
 
     @align.setter
     def align(self, value):
-        if not value:
-            self._align = None
-        else:
-            value = validators.string(value)
-            value = value.lower()
-            if value not in ['left', 'center', 'right']:
-                raise errors.HighchartsValueError(f'align must be either "left", "center"'
-                                                  f', or "right". Was: "{value}"')
-            self._align = value
+        self._align = utility_functions.validate_enum(value,
+                                                      constants.LEGEND_ALIGN_VALUES,
+                                                      'align')
 
     @property
     def align_columns(self) -> Optional[bool]:
@@ -182,10 +146,7 @@ class Legend(HighchartsMeta):
 
     @align_columns.setter
     def align_columns(self, value):
-        if value is None:
-            self._align_columns = None
-        else:
-            self._align_columns = bool(value)
+        self._align_columns = utility_functions.validate_bool(value)
 
     @property
     def background_color(self) -> Optional[str | Gradient | Pattern]:
@@ -200,7 +161,6 @@ class Legend(HighchartsMeta):
 
     @background_color.setter
     def background_color(self, value):
-        from highcharts_core import utility_functions
         self._background_color = utility_functions.validate_color(value)
 
     @property
@@ -217,7 +177,6 @@ class Legend(HighchartsMeta):
 
     @border_color.setter
     def border_color(self, value):
-        from highcharts_core import utility_functions
         self._border_color = utility_functions.validate_color(value)
 
     @property
@@ -232,7 +191,7 @@ class Legend(HighchartsMeta):
 
     @border_radius.setter
     def border_radius(self, value):
-        self._border_radius = validators.numeric(value, allow_empty = True)
+        self._border_radius = utility_functions.validate_numeric(value)
 
     @property
     def border_width(self) -> Optional[int | float | Decimal]:
@@ -246,7 +205,7 @@ class Legend(HighchartsMeta):
 
     @border_width.setter
     def border_width(self, value):
-        self._border_width = validators.numeric(value, allow_empty = True)
+        self._border_width = utility_functions.validate_numeric(value)
 
     @property
     def bubble_legend(self) -> Optional[BubbleLegend]:
@@ -276,7 +235,7 @@ class Legend(HighchartsMeta):
 
     @class_name.setter
     def class_name(self, value):
-        self._class_name = validators.string(value, allow_empty = True)
+        self._class_name = utility_functions.validate_string(value)
 
     @property
     def enabled(self) -> Optional[bool]:
@@ -296,10 +255,7 @@ class Legend(HighchartsMeta):
 
     @enabled.setter
     def enabled(self, value):
-        if value is None:
-            self._enabled = None
-        else:
-            self._enabled = bool(value)
+        self._enabled = utility_functions.validate_bool(value)
 
     @property
     def floating(self) -> Optional[bool]:
@@ -313,10 +269,7 @@ class Legend(HighchartsMeta):
 
     @floating.setter
     def floating(self, value):
-        if value is None:
-            self._floating = None
-        else:
-            self._floating = bool(value)
+        self._floating = utility_functions.validate_bool(value)
 
     @property
     def item_checkbox_style(self) -> Optional[str | dict]:
@@ -349,9 +302,7 @@ class Legend(HighchartsMeta):
 
     @item_distance.setter
     def item_distance(self, value):
-        self._item_distance = validators.numeric(value,
-                                                 allow_empty = True,
-                                                 minimum = 0)
+        self._item_distance = utility_functions.validate_numeric(value, minimum = 0)
 
     @property
     def item_hidden_style(self) -> Optional[str | dict]:
@@ -419,9 +370,7 @@ class Legend(HighchartsMeta):
 
     @item_margin_bottom.setter
     def item_margin_bottom(self, value):
-        self._item_margin_bottom = validators.numeric(value,
-                                                      allow_empty = True,
-                                                      minimum = 0)
+        self._item_margin_bottom = utility_functions.validate_numeric(value, minimum = 0)
 
     @property
     def item_margin_top(self) -> Optional[int | float | Decimal]:
@@ -434,9 +383,7 @@ class Legend(HighchartsMeta):
 
     @item_margin_top.setter
     def item_margin_top(self, value):
-        self._item_margin_top = validators.numeric(value,
-                                                      allow_empty = True,
-                                                      minimum = 0)
+        self._item_margin_top = utility_functions.validate_numeric(value, minimum = 0)
 
     @property
     def item_style(self) -> Optional[str | dict]:
@@ -481,9 +428,7 @@ class Legend(HighchartsMeta):
 
     @item_width.setter
     def item_width(self, value):
-        self._item_width = validators.numeric(value,
-                                              allow_empty = True,
-                                              minimum = 0)
+        self._item_width = utility_functions.validate_numeric(value, minimum = 0)
 
     @property
     def label_format(self) -> Optional[str]:
@@ -501,7 +446,7 @@ class Legend(HighchartsMeta):
 
     @label_format.setter
     def label_format(self, value):
-        self._label_format = validators.string(value, allow_empty = True)
+        self._label_format = utility_functions.validate_string(value)
 
     @property
     def label_formatter(self) -> Optional[CallbackFunction]:
@@ -542,16 +487,9 @@ class Legend(HighchartsMeta):
 
     @layout.setter
     def layout(self, value):
-        if not value:
-            self._layout = None
-        else:
-            value = validators.string(value)
-            value = value.lower()
-            if value not in ['horizontal', 'vertical', 'proximate']:
-                raise errors.HighchartsValueError(f'layout must be either "horizontal", '
-                                                  f', "vertical", or "proximate". Was: '
-                                                  f'"{value}"')
-            self._layout = value
+        self._layout = utility_functions.validate_enum(value,
+                                                       constants.LEGEND_LAYOUT_VALUES,
+                                                       'layout')
 
     @property
     def margin(self) -> Optional[int | float | Decimal]:
@@ -565,8 +503,7 @@ class Legend(HighchartsMeta):
 
     @margin.setter
     def margin(self, value):
-        self._margin = validators.numeric(value,
-                                          allow_empty = True)
+        self._margin = utility_functions.validate_numeric(value)
 
     @property
     def max_height(self) -> Optional[int | float | Decimal]:
@@ -581,9 +518,7 @@ class Legend(HighchartsMeta):
 
     @max_height.setter
     def max_height(self, value):
-        self._max_height = validators.numeric(value,
-                                              allow_empty = True,
-                                              minimum = 0)
+        self._max_height = utility_functions.validate_numeric(value, minimum = 0)
 
     @property
     def navigation(self) -> Optional[LegendNavigation]:
@@ -615,7 +550,7 @@ class Legend(HighchartsMeta):
 
     @padding.setter
     def padding(self, value):
-        self._padding = validators.numeric(value, allow_empty = True)
+        self._padding = utility_functions.validate_numeric(value)
 
     @property
     def reversed(self) -> Optional[bool]:
@@ -629,10 +564,7 @@ class Legend(HighchartsMeta):
 
     @reversed.setter
     def reversed(self, value):
-        if value is None:
-            self._reversed = None
-        else:
-            self._reversed = bool(value)
+        self._reversed = utility_functions.validate_bool(value)
 
     @property
     def rtl(self) -> Optional[bool]:
@@ -646,10 +578,7 @@ class Legend(HighchartsMeta):
 
     @rtl.setter
     def rtl(self, value):
-        if value is None:
-            self._rtl = None
-        else:
-            self._rtl = bool(value)
+        self._rtl = utility_functions.validate_bool(value)
 
     @property
     def shadow(self) -> Optional[bool | ShadowOptions]:
@@ -695,10 +624,7 @@ class Legend(HighchartsMeta):
 
     @square_symbol.setter
     def square_symbol(self, value):
-        if value is None:
-            self._square_symbol = None
-        else:
-            self._square_symbol = bool(value)
+        self._square_symbol = utility_functions.validate_bool(value)
 
     @property
     def symbol_height(self) -> Optional[int | float | Decimal]:
@@ -711,9 +637,7 @@ class Legend(HighchartsMeta):
 
     @symbol_height.setter
     def symbol_height(self, value):
-        self._symbol_height = validators.numeric(value,
-                                                 allow_empty = True,
-                                                 minimum = 0)
+        self._symbol_height = utility_functions.validate_numeric(value, minimum = 0)
 
     @property
     def symbol_padding(self) -> Optional[int | float | Decimal]:
@@ -726,7 +650,7 @@ class Legend(HighchartsMeta):
 
     @symbol_padding.setter
     def symbol_padding(self, value):
-        self._symbol_padding = validators.numeric(value, allow_empty = True)
+        self._symbol_padding = utility_functions.validate_numeric(value)
 
     @property
     def symbol_radius(self) -> Optional[int | float | Decimal]:
@@ -739,7 +663,7 @@ class Legend(HighchartsMeta):
 
     @symbol_radius.setter
     def symbol_radius(self, value):
-        self._symbol_radius = validators.numeric(value, allow_empty = True)
+        self._symbol_radius = utility_functions.validate_numeric(value)
 
     @property
     def symbol_width(self) -> Optional[int | float | Decimal]:
@@ -753,9 +677,7 @@ class Legend(HighchartsMeta):
 
     @symbol_width.setter
     def symbol_width(self, value):
-        self._symbol_width = validators.numeric(value,
-                                                allow_empty = True,
-                                                minimum = 0)
+        self._symbol_width = utility_functions.validate_numeric(value, minimum = 0)
 
     @property
     def title(self) -> Optional[LegendTitle]:
@@ -784,10 +706,7 @@ class Legend(HighchartsMeta):
 
     @use_html.setter
     def use_html(self, value):
-        if value is None:
-            self._use_html = None
-        else:
-            self._use_html = bool(value)
+        self._use_html = utility_functions.validate_bool(value)
 
     @property
     def vertical_align(self) -> Optional[str]:
@@ -818,15 +737,11 @@ class Legend(HighchartsMeta):
 
     @vertical_align.setter
     def vertical_align(self, value):
-        if not value:
-            self._vertical_align = None
-        else:
-            value = validators.string(value, allow_empty = True)
-            value = value.lower()
-            if value not in ['bottom', 'middle', 'top']:
-                raise errors.HighchartsValueError(f'vertical_align expects either "top", '
-                                                  f'"middle", or "bottom". Was: {value}')
-            self._vertical_align = value
+        self._vertical_align = utility_functions.validate_enum(
+            value,
+            constants.LEGEND_VERTICAL_ALIGN_VALUES,
+            'vertical_align'
+        )
 
     @property
     def width(self) -> Optional[str | int | float | Decimal]:
@@ -848,17 +763,10 @@ class Legend(HighchartsMeta):
     def width(self, value):
         if not value:
             self._width = None
+        elif isinstance(value, str) and '%' in value:
+            self._width = value
         else:
-            try:
-                value = validators.string(value)
-                if '%' not in value:
-                    raise errors.HighchartsValueError(f'if width is a string, it is '
-                                                      f'expected to be a percentage of '
-                                                      f'the chart area. No % sign found '
-                                                      f'in value: {value}')
-                self._width = value
-            except (TypeError, ValueError):
-                self._width = validators.numeric(value, minimum = 0)
+            self._width = utility_functions.validate_numeric(value, minimum = 0)
 
     @property
     def x(self) -> Optional[int]:
@@ -876,7 +784,7 @@ class Legend(HighchartsMeta):
 
     @x.setter
     def x(self, value):
-        self._x = validators.numeric(value, allow_empty = True)
+        self._x = utility_functions.validate_numeric(value)
 
     @property
     def y(self) -> Optional[int]:
@@ -894,97 +802,16 @@ class Legend(HighchartsMeta):
 
     @y.setter
     def y(self, value):
-        self._y = validators.numeric(value, allow_empty = True)
+        self._y = utility_functions.validate_numeric(value)
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'accessibility': as_dict.get('accessibility', None),
-            'align': as_dict.get('align', None),
-            'align_columns': as_dict.get('alignColumns', None),
-            'background_color': as_dict.get('backgroundColor', None),
-            'border_color': as_dict.get('borderColor', None),
-            'border_width': as_dict.get('borderWidth', None),
-            'border_radius': as_dict.get('borderRadius', None),
-            'bubble_legend': as_dict.get('bubbleLegend', None),
-            'class_name': as_dict.get('className', None),
-            'enabled': as_dict.get('enabled', None),
-            'floating': as_dict.get('floating', None),
-            'item_checkbox_style': as_dict.get('itemCheckboxStyle', None),
-            'item_distance': as_dict.get('itemDistance', None),
-            'item_hidden_style': as_dict.get('itemHiddenStyle', None),
-            'item_hover_style': as_dict.get('itemHoverStyle', None),
-            'item_margin_bottom': as_dict.get('itemMarginBottom', None),
-            'item_margin_top': as_dict.get('itemMarginTop', None),
-            'item_style': as_dict.get('itemStyle', None),
-            'item_width': as_dict.get('itemWidth', None),
-            'label_format': as_dict.get('labelFormat', None),
-            'label_formatter': as_dict.get('labelFormatter', None),
-            'layout': as_dict.get('layout', None),
-            'margin': as_dict.get('margin', None),
-            'max_height': as_dict.get('maxHeight', None),
-            'navigation': as_dict.get('navigation', None),
-            'padding': as_dict.get('padding', None),
-            'reversed': as_dict.get('reversed', None),
-            'rtl': as_dict.get('rtl', None),
-            'shadow': as_dict.get('shadow', None),
-            'square_symbol': as_dict.get('squareSymbol', None),
-            'symbol_height': as_dict.get('symbolHeight', None),
-            'symbol_padding': as_dict.get('symbolPadding', None),
-            'symbol_radius': as_dict.get('symbolRadius', None),
-            'symbol_width': as_dict.get('symbolWidth', None),
-            'title': as_dict.get('title', None),
-            'use_html': as_dict.get('useHTML', None),
-            'vertical_align': as_dict.get('verticalAlign', None),
-            'width': as_dict.get('width', None),
-            'x': as_dict.get('x', None),
-            'y': as_dict.get('y', None),
-        }
+        get_value = as_dict.get
+        kwargs = {name: get_value(key, None) for name, key in Legend._KEY_MAP}
 
         return kwargs
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'accessibility': self.accessibility,
-            'align': self.align,
-            'alignColumns': self.align_columns,
-            'backgroundColor': self.background_color,
-            'borderColor': self.border_color,
-            'borderWidth': self.border_width,
-            'borderRadius': self.border_radius,
-            'bubbleLegend': self.bubble_legend,
-            'className': self.class_name,
-            'enabled': self.enabled,
-            'floating': self.floating,
-            'itemCheckboxStyle': self.item_checkbox_style,
-            'itemDistance': self.item_distance,
-            'itemHiddenStyle': self.item_hidden_style,
-            'itemHoverStyle': self.item_hover_style,
-            'itemMarginBottom': self.item_margin_bottom,
-            'itemMarginTop': self.item_margin_top,
-            'itemStyle': self.item_style,
-            'itemWidth': self.item_width,
-            'labelFormat': self.label_format,
-            'labelFormatter': self.label_formatter,
-            'layout': self.layout,
-            'margin': self.margin,
-            'maxHeight': self.max_height,
-            'navigation': self.navigation,
-            'padding': self.padding,
-            'reversed': self.reversed,
-            'rtl': self.rtl,
-            'shadow': self.shadow,
-            'squareSymbol': self.square_symbol,
-            'symbolHeight': self.symbol_height,
-            'symbolPadding': self.symbol_padding,
-            'symbolRadius': self.symbol_radius,
-            'symbolWidth': self.symbol_width,
-            'title': self.title,
-            'useHTML': self.use_html,
-            'verticalAlign': self.vertical_align,
-            'width': self.width,
-            'x': self.x,
-            'y': self.y
-        }
+        untrimmed = {key: getattr(self, name) for name, key in Legend._KEY_MAP}
 
         return untrimmed
@@ -204,10 +204,7 @@ class AreaOptions(SeriesOptions):
             'negativeFillColor': self.negative_fill_color,
             'trackByArea': self.track_by_area,
         }
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls)
-
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls))
 
         return untrimmed
 
@@ -328,10 +325,7 @@ class AreaRangeOptions(AreaOptions):
         untrimmed = {
             'lowMarker': self.low_marker,
         }
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls)
-
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls))
 
         return untrimmed
 
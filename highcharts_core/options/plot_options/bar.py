@@ -402,10 +402,7 @@ class BaseBarOptions(SeriesOptions):
             'pointRange': self.point_range,
             'pointWidth': self.point_width
         }
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls)
-
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls))
 
         return untrimmed
 
@@ -589,10 +586,7 @@ class BarOptions(BaseBarOptions):
             'edgeWidth': self.edge_width,
             'groupZPadding': self.group_z_padding
         }
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls)
-
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls))
 
         return untrimmed
 
@@ -882,10 +876,7 @@ class WaterfallOptions(ColumnOptions):
             'lineColor': self.line_color,
             'upColor': self.up_color
         }
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls)
-
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls))
 
         return untrimmed
 
@@ -1107,10 +1098,7 @@ class WindBarbOptions(BarOptions):
             'xOffset': self.x_offset,
             'yOffset': self.y_offset,
         }
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls)
-
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls))
 
         return untrimmed
 
@@ -1280,9 +1268,6 @@ class XRangeOptions(BaseBarOptions):
             'groupZPadding': self.group_z_padding,
             'partialFill': self.partial_fill
         }
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls)
-
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls))
 
         return untrimmed
@@ -82,7 +82,7 @@ class BoxPlotOptions(BarOptions):
             self._box_dash_style = None
         else:
             value = validators.string(value)
-            if value not in constants.SUPPORTED_DASH_STYLE_VALUES:
+            if value not in constants._DASH_STYLE_SET:
                 raise errors.HighchartsValueError(f'box_dash_style expects a recognized '
                                                   f'value, but received: {value}')
             self._box_dash_style = value
@@ -150,7 +150,7 @@ class BoxPlotOptions(BarOptions):
             self._median_dash_style = None
         else:
             value = validators.string(value)
-            if value not in constants.SUPPORTED_DASH_STYLE_VALUES:
+            if value not in constants._DASH_STYLE_SET:
                 raise errors.HighchartsValueError(f'median_dash_style expects a '
                                                   f' recognized value, but received: '
                                                   f'{value}')
@@ -200,7 +200,7 @@ class BoxPlotOptions(BarOptions):
             self._stem_dash_style = None
         else:
             value = validators.string(value)
-            if value not in constants.SUPPORTED_DASH_STYLE_VALUES:
+            if value not in constants._DASH_STYLE_SET:
                 raise errors.HighchartsValueError(f'stem_dash_style expects a recognized'
                                                   f' value, but received: {value}')
             self._stem_dash_style = value
@@ -265,7 +265,7 @@ class BoxPlotOptions(BarOptions):
             self._whisker_dash_style = None
         else:
             value = validators.string(value)
-            if value not in constants.SUPPORTED_DASH_STYLE_VALUES:
+            if value not in constants._DASH_STYLE_SET:
                 raise errors.HighchartsValueError(f'whisker_dash_style expects a '
                                                   f'recognized value, but received: '
                                                   f'{value}')
@@ -435,10 +435,7 @@ class BoxPlotOptions(BarOptions):
             'whiskerLength': self.whisker_length,
             'whiskerWidth': self.whisker_width
         }
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls)
-
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls))
 
         return untrimmed
 
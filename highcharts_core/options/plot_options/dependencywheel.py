@@ -407,9 +407,6 @@ class DependencyWheelOptions(GenericTypeOptions):
             'nodeWidth': self.node_width,
             'startAngle': self.start_angle
         }
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls)
-
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls))
 
         return untrimmed
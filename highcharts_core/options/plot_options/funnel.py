@@ -272,10 +272,7 @@ class FunnelOptions(PieOptions):
             'reversed': self.reversed,
             'width': self.width
         }
-        parent_as_dict = self._untrimmed_mro_ancestors(in_cls = in_cls)
-
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(self._untrimmed_mro_ancestors(in_cls = in_cls))
 
         return untrimmed
 
@@ -342,9 +339,6 @@ class Funnel3DOptions(FunnelOptions, ColumnOptions):
         untrimmed = {
             'gradientForSides': self.gradient_for_sides,
         }
-        parent_as_dict = self._untrimmed_mro_ancestors(in_cls = in_cls)
-
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(self._untrimmed_mro_ancestors(in_cls = in_cls))
 
         return untrimmed
@@ -713,10 +713,7 @@ class GaugeOptions(GenericTypeOptions):
             'shadow': self.shadow,
             'wrap': self.wrap
         }
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls)
-
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls))
 
         return untrimmed
 
@@ -914,9 +911,6 @@ class SolidGaugeOptions(SeriesOptions):
             'radius': self.radius,
             'rounded': self.rounded
         }
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls)
-
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls))
 
         return untrimmed
@@ -354,7 +354,7 @@ class GenericTypeOptions(HighchartsMeta):
             self._dash_style = None
         else:
             value = validators.string(value)
-            if value not in constants.SUPPORTED_DASH_STYLE_VALUES:
+            if value not in constants._DASH_STYLE_SET:
                 raise errors.HighchartsValueError(f'dash_style expects a recognized value'
                                                   f', but received: {value}')
             self._dash_style = value
@@ -203,9 +203,6 @@ class HistogramOptions(BarOptions):
             'binsNumber': self.bins_number,
             'binWidth': self.bin_width
         }
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls)
-
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls))
 
         return untrimmed
@@ -3,7 +3,7 @@ from decimal import Decimal
 
 from validator_collection import validators
 
-from highcharts_core import errors, constants
+from highcharts_core import errors, constants, utility_functions
 from highcharts_core.decorators import class_sensitive
 from highcharts_core.metaclasses import HighchartsMeta
 from highcharts_core.utility_classes.data_labels import DataLabel
@@ -188,9 +188,7 @@ class LevelOptions(BaseLevelOptions):
             'linkOpacity': self.link_opacity,
             'states': self.states
         }
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls)
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls))
 
         return untrimmed
 
@@ -369,7 +367,7 @@ class SunburstLevelOptions(BaseLevelOptions):
             self._border_dash_style = None
         else:
             value = validators.string(value)
-            if value not in constants.SUPPORTED_DASH_STYLE_VALUES:
+            if value not in constants._DASH_STYLE_SET:
                 raise errors.HighchartsValueError(f'border_dash_style expects a '
                                                   f'recognized value, but received: '
                                                   f'{value}')
@@ -442,9 +440,7 @@ class SunburstLevelOptions(BaseLevelOptions):
             'levelSize': self.level_size
         }
 
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls)
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls))
 
         return untrimmed
 
@@ -497,7 +493,7 @@ class TreemapLevelOptions(BaseLevelOptions):
             self._border_dash_style = None
         else:
             value = validators.string(value)
-            if value not in constants.SUPPORTED_DASH_STYLE_VALUES:
+            if value not in constants._DASH_STYLE_SET:
                 raise errors.HighchartsValueError(f'border_dash_style expects a '
                                                   f'recognized value, but received: '
                                                   f'{value}')
@@ -574,17 +570,11 @@ class TreemapLevelOptions(BaseLevelOptions):
 
     @layout_starting_direction.setter
     def layout_starting_direction(self, value):
-        if not value:
-            self._layout_starting_direction = None
-        else:
-            value = validators.string(value)
-            value = value.lower()
-            if value not in ['vertical', 'horizontal']:
-                raise errors.HighchartsError(f'layout_starting_direction expects either '
-                                             f'"vertical" or "horizontal". Received: '
-                                             f'{value}')
-
-            self._layout_starting_direction = value
+        self._layout_starting_direction = utility_functions.validate_enum(
+            value,
+            constants.LAYOUT_STARTING_DIRECTION_VALUES,
+            'layout_starting_direction'
+        )
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
@@ -613,9 +603,7 @@ class TreemapLevelOptions(BaseLevelOptions):
             'layoutStartingDirection': self.layout_starting_direction
         }
 
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls)
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls))
 
         return untrimmed
 
@@ -697,9 +697,6 @@ class NetworkGraphOptions(GenericTypeOptions):
             'shadow': self.shadow,
             'zones': self.zones
         }
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls)
-
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls))
 
         return untrimmed
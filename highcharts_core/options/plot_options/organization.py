@@ -441,9 +441,6 @@ class OrganizationOptions(BarOptions):
             'nodePadding': self.node_padding,
             'nodeWidth': self.node_width
         }
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls)
-
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls))
 
         return untrimmed
@@ -333,9 +333,6 @@ class PackedBubbleOptions(NetworkGraphOptions):
             'useSimulation': self.use_simulation,
             'zThreshold': self.z_threshold
         }
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls)
-
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls))
 
         return untrimmed
@@ -326,9 +326,6 @@ class PictorialOptions(SeriesOptions):
             'pointRange': self.point_range,
             'pointWidth': self.point_width,
         }
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls)
-
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls))
 
         return untrimmed
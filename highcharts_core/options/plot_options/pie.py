@@ -614,10 +614,7 @@ class PieOptions(GenericTypeOptions):
             'startAngle': self.start_angle,
             'thickness': self.thickness
         }
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls)
-
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls))
 
         return untrimmed
 
@@ -836,9 +833,6 @@ class VariablePieOptions(PieOptions):
             'zMax': self.z_max,
             'zMin': self.z_min
         }
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls)
-
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls))
 
         return untrimmed
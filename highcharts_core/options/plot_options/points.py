@@ -58,7 +58,7 @@ class ConnectorOptions(HighchartsMeta):
             self._dashstyle = None
         else:
             value = validators.string(value)
-            if value not in constants.SUPPORTED_DASH_STYLE_VALUES:
+            if value not in constants._DASH_STYLE_SET:
                 raise errors.HighchartsValueError(f'dashstyle expects a recognized value'
                                                   f', but received: {value}')
             self._dashstyle = value
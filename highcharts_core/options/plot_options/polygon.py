@@ -119,9 +119,6 @@ class PolygonOptions(SeriesOptions):
         untrimmed = {
             'trackByArea': self.track_by_area,
         }
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls)
-
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls))
 
         return untrimmed
@@ -3,7 +3,7 @@ from decimal import Decimal
 
 from validator_collection import validators
 
-from highcharts_core import errors
+from highcharts_core import constants, errors, utility_functions
 from highcharts_core.options.plot_options.dependencywheel import DependencyWheelOptions
 
 
@@ -34,6 +34,13 @@ class SankeyOptions(DependencyWheelOptions):
           :align: center
 
     """
+
+    _KEY_MAP = (
+        ('link_color_mode', 'linkColorMode'),
+        ('node_alignment', 'nodeAlignment'),
+        ('node_distance', 'nodeDistance'),
+    )
+
     def __init__(self, **kwargs):
         self._link_color_mode = None
         self._node_alignment = None
@@ -64,16 +71,11 @@ class SankeyOptions(DependencyWheelOptions):
     
     @link_color_mode.setter
     def link_color_mode(self, value):
-        if not value:
-            self._link_color_mode = None
-        else:
-            value = validators.string(value)
-            value = value.lower()
-            if value not in ['from', 'gradient', 'to']:
-                raise errors.HighchartsValueError(
-                    f'link_color_mode expects a value of either "from", '
-                    f'"gradient", or "to". Received "{value}"')
-            self._link_color_mode = value
+        self._link_color_mode = utility_functions.validate_enum(
+            value,
+            constants.LINK_COLOR_MODE_VALUES,
+            'link_color_mode'
+        )
 
     @property
     def node_alignment(self) -> Optional[str]:
@@ -175,73 +177,15 @@ class SankeyOptions(DependencyWheelOptions):
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'accessibility': as_dict.get('accessibility', None),
-            'allow_point_select': as_dict.get('allowPointSelect', None),
-            'animation': as_dict.get('animation', None),
-            'class_name': as_dict.get('className', None),
-            'clip': as_dict.get('clip', None),
-            'color': as_dict.get('color', None),
-            'cursor': as_dict.get('cursor', None),
-            'custom': as_dict.get('custom', None),
-            'dash_style': as_dict.get('dashStyle', None),
-            'data_labels': as_dict.get('dataLabels', None),
-            'description': as_dict.get('description', None),
-            'enable_mouse_tracking': as_dict.get('enableMouseTracking', None),
-            'events': as_dict.get('events', None),
-            'include_in_data_export': as_dict.get('includeInDataExport', None),
-            'keys': as_dict.get('keys', None),
-            'label': as_dict.get('label', None),
-            'legend_symbol': as_dict.get('legendSymbol', None),
-            'linked_to': as_dict.get('linkedTo', None),
-            'marker': as_dict.get('marker', None),
-            'on_point': as_dict.get('onPoint', None),
-            'opacity': as_dict.get('opacity', None),
-            'point': as_dict.get('point', None),
-            'point_description_formatter': as_dict.get('pointDescriptionFormatter', None),
-            'selected': as_dict.get('selected', None),
-            'show_checkbox': as_dict.get('showCheckbox', None),
-            'show_in_legend': as_dict.get('showInLegend', None),
-            'skip_keyboard_navigation': as_dict.get('skipKeyboardNavigation', None),
-            'sonification': as_dict.get('sonification', None),
-            'states': as_dict.get('states', None),
-            'sticky_tracking': as_dict.get('stickyTracking', None),
-            'threshold': as_dict.get('threshold', None),
-            'tooltip': as_dict.get('tooltip', None),
-            'turbo_threshold': as_dict.get('turboThreshold', None),
-            'visible': as_dict.get('visible', None),
-
-            'border_color': as_dict.get('borderColor', None),
-            'border_width': as_dict.get('borderWidth', None),
-            'center': as_dict.get('center', None),
-            'center_in_category': as_dict.get('centerInCategory', None),
-            'color_by_point': as_dict.get('colorByPoint', None),
-            'color_index': as_dict.get('colorIndex', None),
-            'colors': as_dict.get('colors', None),
-            'curve_factor': as_dict.get('curveFactor', None),
-            'levels': as_dict.get('levels', None),
-            'link_opacity': as_dict.get('linkOpacity', None),
-            'min_link_width': as_dict.get('minLinkWidth', None),
-            'node_padding': as_dict.get('nodePadding', None),
-            'node_width': as_dict.get('nodeWidth', None),
-            'start_angle': as_dict.get('startAngle', None),
-            
-            'link_color_mode': as_dict.get('linkColorMode', None),
-            'node_alignment': as_dict.get('nodeAlignment', None),
-            'node_distance': as_dict.get('nodeDistance', None),
-        }
+        kwargs = super()._get_kwargs_from_dict(as_dict)
+
+        for name, key in SankeyOptions._KEY_MAP:
+            kwargs[name] = as_dict.get(key, None)
 
         return kwargs
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'linkColorMode': self.link_color_mode,
-            'nodeAlignment': self.node_alignment,
-            'nodeDistance': self.node_distance,
-        }
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls)
-
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed = {key: getattr(self, name) for name, key in SankeyOptions._KEY_MAP}
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls))
 
         return untrimmed
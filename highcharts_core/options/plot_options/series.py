@@ -4,7 +4,7 @@ from decimal import Decimal
 
 from validator_collection import validators, checkers
 
-from highcharts_core import errors
+from highcharts_core import constants, errors, utility_functions
 from highcharts_core.decorators import class_sensitive, validate_types
 from highcharts_core.options.plot_options.generic import GenericTypeOptions
 from highcharts_core.utility_classes.gradients import Gradient
@@ -543,10 +543,7 @@ class SeriesBaseOptions(GenericTypeOptions):
             'zoneAxis': self.zone_axis,
             'zones': self.zones
         }
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls)
-
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls))
 
         return untrimmed
 
@@ -854,15 +851,9 @@ class SeriesOptions(SeriesBaseOptions):
 
     @stacking.setter
     def stacking(self, value):
-        if not value:
-            self._stacking = None
-        else:
-            value = validators.string(value)
-            value = value.lower()
-            if value not in ['normal', 'percent', 'stream', 'overlap']:
-                raise errors.HighchartsValueError(f'stacking expects a valid stacking '
-                                                  f'value. However, received: {value}')
-            self._stacking = value
+        self._stacking = utility_functions.validate_enum(value,
+                                                         constants.STACKING_VALUES,
+                                                         'stacking')
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
@@ -950,9 +941,6 @@ class SeriesOptions(SeriesBaseOptions):
             'pointStart': self.point_start,
             'stacking': self.stacking,
         }
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls)
-
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls))
 
         return untrimmed
@@ -540,9 +540,6 @@ class SunburstOptions(GenericTypeOptions):
             'slicedOffset': self.sliced_offset,
             'startAngle': self.start_angle
         }
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls)
-
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls))
 
         return untrimmed
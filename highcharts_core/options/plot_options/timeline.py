@@ -345,8 +345,6 @@ class TimelineOptions(GenericTypeOptions):
             'relativeXValue': self.relative_x_value,
             'shadow': self.shadow
         }
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls) or {}
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls) or {})
 
         return untrimmed
@@ -4,7 +4,7 @@ from decimal import Decimal
 
 from validator_collection import validators
 
-from highcharts_core import errors
+from highcharts_core import constants, utility_functions
 from highcharts_core.decorators import class_sensitive
 from highcharts_core.options.plot_options.generic import GenericTypeOptions
 from highcharts_core.utility_classes.buttons import CollapseButtonConfiguration
@@ -532,15 +532,9 @@ class TreegraphOptions(GenericTypeOptions):
 
     @stacking.setter
     def stacking(self, value):
-        if not value:
-            self._stacking = None
-        else:
-            value = validators.string(value)
-            value = value.lower()
-            if value not in ['normal', 'percent', 'stream', 'overlap']:
-                raise errors.HighchartsValueError(f'stacking expects a valid stacking '
-                                                  f'value. However, received: {value}')
-            self._stacking = value
+        self._stacking = utility_functions.validate_enum(value,
+                                                         constants.STACKING_VALUES,
+                                                         'stacking')
 
     @property
     def allow_traversing_tree(self) -> Optional[bool]:
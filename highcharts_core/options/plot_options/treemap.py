@@ -3,7 +3,7 @@ from decimal import Decimal
 
 from validator_collection import validators
 
-from highcharts_core import errors, utility_functions
+from highcharts_core import constants, utility_functions
 from highcharts_core.decorators import class_sensitive
 from highcharts_core.options.plot_options.generic import GenericTypeOptions
 from highcharts_core.utility_classes.zones import Zone
@@ -25,82 +25,52 @@ class TreemapOptions(GenericTypeOptions):
 
     """
 
+    _KEY_MAP = (
+        ('allow_traversing_tree', 'allowTraversingTree'),
+        ('alternate_starting_direction', 'alternateStartingDirection'),
+        ('animation_limit', 'animationLimit'),
+        ('boost_blending', 'boostBlending'),
+        ('boost_threshold', 'boostThreshold'),
+        ('breadcrumbs', 'breadcrumbs'),
+        ('color_axis', 'colorAxis'),
+        ('color_by_point', 'colorByPoint'),
+        ('color_index', 'colorIndex'),
+        ('color_key', 'colorKey'),
+        ('colors', 'colors'),
+        ('crisp', 'crisp'),
+        ('crop_threshold', 'cropThreshold'),
+        ('find_nearest_point_by', 'findNearestPointBy'),
+        ('get_extremes_from_all', 'getExtremesFromAll'),
+        ('ignore_hidden_point', 'ignoreHiddenPoint'),
+        ('interact_by_leaf', 'interactByLeaf'),
+        ('layout_algorithm', 'layoutAlgorithm'),
+        ('layout_starting_direction', 'layoutStartingDirection'),
+        ('level_is_constant', 'levelIsConstant'),
+        ('levels', 'levels'),
+        ('linecap', 'linecap'),
+        ('line_width', 'lineWidth'),
+        ('negative_color', 'negativeColor'),
+        ('point_interval', 'pointInterval'),
+        ('point_interval_unit', 'pointIntervalUnit'),
+        ('point_start', 'pointStart'),
+        ('relative_x_value', 'relativeXValue'),
+        ('soft_threshold', 'softThreshold'),
+        ('sort_index', 'sortIndex'),
+        ('stacking', 'stacking'),
+        ('step', 'step'),
+        ('zone_axis', 'zoneAxis'),
+        ('zones', 'zones'),
+    )
+    _DEFAULTS = dict.fromkeys('_' + name for name, _ in _KEY_MAP)
+
     def __init__(self, **kwargs):
-        self._animation_limit = None
-        self._boost_blending = None
-        self._boost_threshold = None
-        self._border_radius = None
-        self._color_axis = None
-        self._color_key = None
-        self._colors = None
-        self._crop_threshold = None
-        self._find_nearest_point_by = None
-        self._get_extremes_from_all = None
-        self._ignore_hidden_point = None
-        self._linecap = None
-        self._line_width = None
-        self._negative_color = None
-        self._point_interval = None
-        self._point_interval_unit = None
-        self._point_start = None
-        self._relative_x_value = None
-        self._soft_threshold = None
-        self._stacking = None
-        self._step = None
-        self._zone_axis = None
-        self._zones = None
-
-        self._color_by_point = None
-        self._color_index = None
-        self._crisp = None
-        self._allow_traversing_tree = None
-        self._breadcrumbs = None
-        self._level_is_constant = None
-        self._levels = None
-
-        self._alternate_starting_direction = None
-        self._interact_by_leaf = None
-        self._layout_algorithm = None
-        self._layout_starting_direction = None
-        self._sort_index = None
-
-        self.animation_limit = kwargs.get('animation_limit', None)
-        self.boost_blending = kwargs.get('boost_blending', None)
-        self.boost_threshold = kwargs.get('boost_threshold', None)
-        self.color_axis = kwargs.get('color_axis', None)
-        self.color_key = kwargs.get('color_key', None)
-        self.colors = kwargs.get('colors', None)
-        self.crop_threshold = kwargs.get('crop_threshold', None)
-        self.find_nearest_point_by = kwargs.get('find_nearest_point_by', None)
-        self.get_extremes_from_all = kwargs.get('get_extremes_from_all', None)
-        self.ignore_hidden_point = kwargs.get('ignore_hidden_point', None)
-        self.linecap = kwargs.get('linecap', None)
-        self.line_width = kwargs.get('line_width', None)
-        self.negative_color = kwargs.get('negative_color', None)
-        self.point_interval = kwargs.get('point_interval', None)
-        self.point_interval_unit = kwargs.get('point_interval_unit', None)
-        self.point_start = kwargs.get('point_start', None)
-        self.relative_x_value = kwargs.get('relative_x_value', None)
-        self.soft_threshold = kwargs.get('soft_threshold', None)
-        self.stacking = kwargs.get('stacking', None)
-        self.step = kwargs.get('step', None)
-        self.zone_axis = kwargs.get('zone_axis', None)
-        self.zones = kwargs.get('zones', None)
-
-        self.color_index = kwargs.get('color_index', None)
-        self.crisp = kwargs.get('crisp', None)
-        self.allow_traversing_tree = kwargs.get('allow_traversing_tree', None)
-        self.breadcrumbs = kwargs.get('breadcrumbs', None)
-        self.color_by_point = kwargs.get('color_by_point', None)
-        self.level_is_constant = kwargs.get('level_is_constant', None)
-        self.levels = kwargs.get('levels', None)
-
-        self.alternate_starting_direction = kwargs.get('alternate_starting_direction',
-                                                       None)
-        self.interact_by_leaf = kwargs.get('interact_by_leaf', None)
-        self.layout_algorithm = kwargs.get('layout_algorithm', None)
-        self.layout_starting_direction = kwargs.get('layout_starting_direction', None)
-        self.sort_index = kwargs.get('sort_index', None)
+        self.__dict__.update(TreemapOptions._DEFAULTS)
+
+        get_kwarg = kwargs.get
+        for name, _ in TreemapOptions._KEY_MAP:
+            value = get_kwarg(name)
+            if value is not None:
+                setattr(self, name, value)
 
         super().__init__(**kwargs)
 
@@ -115,10 +85,7 @@ class TreemapOptions(GenericTypeOptions):
 
     @allow_traversing_tree.setter
     def allow_traversing_tree(self, value):
-        if value is None:
-            self._allow_traversing_tree = None
-        else:
-            self._allow_traversing_tree = bool(value)
+        self._allow_traversing_tree = utility_functions.validate_bool(value)
 
     @property
     def alternate_starting_direction(self) -> Optional[bool]:
@@ -132,10 +99,7 @@ class TreemapOptions(GenericTypeOptions):
 
     @alternate_starting_direction.setter
     def alternate_starting_direction(self, value):
-        if value is None:
-            self._alternate_starting_direction = None
-        else:
-            self._alternate_starting_direction = bool(value)
+        self._alternate_starting_direction = utility_functions.validate_bool(value)
 
     @property
     def animation_limit(self) -> Optional[int | float | Decimal]:
@@ -156,9 +120,8 @@ class TreemapOptions(GenericTypeOptions):
         if value == float('inf'):
             self._animation_limit = float('inf')
         else:
-            self._animation_limit = validators.numeric(value,
-                                                       allow_empty = True,
-                                                       minimum = 0)
+            self._animation_limit = utility_functions.validate_numeric(value,
+                                                                       minimum = 0)
 
     @property
     def boost_blending(self) -> Optional[str]:
@@ -171,7 +134,7 @@ class TreemapOptions(GenericTypeOptions):
 
     @boost_blending.setter
     def boost_blending(self, value):
-        self._boost_blending = validators.string(value, allow_empty = True)
+        self._boost_blending = utility_functions.validate_string(value)
 
     @property
     def boost_threshold(self) -> Optional[int]:
@@ -198,9 +161,7 @@ class TreemapOptions(GenericTypeOptions):
 
     @boost_threshold.setter
     def boost_threshold(self, value):
-        self._boost_threshold = validators.integer(value,
-                                                   allow_empty = True,
-                                                   minimum = 0)
+        self._boost_threshold = utility_functions.validate_integer(value, minimum = 0)
 
     @property
     def breadcrumbs(self) -> Optional[BreadcrumbOptions]:
@@ -257,10 +218,7 @@ class TreemapOptions(GenericTypeOptions):
 
     @color_by_point.setter
     def color_by_point(self, value):
-        if value is None:
-            self._color_by_point = None
-        else:
-            self._color_by_point = bool(value)
+        self._color_by_point = utility_functions.validate_bool(value)
 
     @property
     def color_index(self) -> Optional[int]:
@@ -276,9 +234,7 @@ class TreemapOptions(GenericTypeOptions):
 
     @color_index.setter
     def color_index(self, value):
-        self._color_index = validators.integer(value,
-                                               allow_empty = True,
-                                               minimum = 0)
+        self._color_index = utility_functions.validate_integer(value, minimum = 0)
 
     @property
     def color_key(self) -> Optional[str]:
@@ -296,7 +252,7 @@ class TreemapOptions(GenericTypeOptions):
 
     @color_key.setter
     def color_key(self, value):
-        self._color_key = validators.string(value, allow_empty = True)
+        self._color_key = utility_functions.validate_string(value)
 
     @property
     def colors(self) -> Optional[List[str | Gradient | Pattern]]:
@@ -335,10 +291,7 @@ class TreemapOptions(GenericTypeOptions):
 
     @crisp.setter
     def crisp(self, value):
-        if value is None:
-            self._crisp = None
-        else:
-            self._crisp = bool(value)
+        self._crisp = utility_functions.validate_bool(value)
 
     @property
     def crop_threshold(self) -> Optional[int]:
@@ -358,9 +311,7 @@ class TreemapOptions(GenericTypeOptions):
 
     @crop_threshold.setter
     def crop_threshold(self, value):
-        self._crop_threshold = validators.integer(value,
-                                                   allow_empty = True,
-                                                   minimum = 0)
+        self._crop_threshold = utility_functions.validate_integer(value, minimum = 0)
 
     @property
     def find_nearest_point_by(self) -> Optional[str]:
@@ -380,7 +331,7 @@ class TreemapOptions(GenericTypeOptions):
 
     @find_nearest_point_by.setter
     def find_nearest_point_by(self, value):
-        self._find_nearest_point_by = validators.string(value, allow_empty = True)
+        self._find_nearest_point_by = utility_functions.validate_string(value)
 
     @property
     def get_extremes_from_all(self) -> Optional[bool]:
@@ -398,10 +349,7 @@ class TreemapOptions(GenericTypeOptions):
 
     @get_extremes_from_all.setter
     def get_extremes_from_all(self, value):
-        if value is None:
-            self._get_extremes_from_all = None
-        else:
-            self._get_extremes_from_all = bool(value)
+        self._get_extremes_from_all = utility_functions.validate_bool(value)
 
     @property
     def ignore_hidden_point(self) -> Optional[bool]:
@@ -417,10 +365,7 @@ class TreemapOptions(GenericTypeOptions):
 
     @ignore_hidden_point.setter
     def ignore_hidden_point(self, value):
-        if value is None:
-            self._ignore_hidden_point = None
-        else:
-            self._ignore_hidden_point = bool(value)
+        self._ignore_hidden_point = utility_functions.validate_bool(value)
 
     @property
     def interact_by_leaf(self) -> Optional[bool]:
@@ -437,10 +382,7 @@ class TreemapOptions(GenericTypeOptions):
 
     @interact_by_leaf.setter
     def interact_by_leaf(self, value):
-        if value is None:
-            self._interact_by_leaf = None
-        else:
-            self._interact_by_leaf = bool(value)
+        self._interact_by_leaf = utility_functions.validate_bool(value)
 
     @property
     def layout_algorithm(self) -> Optional[str]:
@@ -484,17 +426,11 @@ class TreemapOptions(GenericTypeOptions):
 
     @layout_starting_direction.setter
     def layout_starting_direction(self, value):
-        if not value:
-            self._layout_starting_direction = None
-        else:
-            value = validators.string(value)
-            value = value.lower()
-            if value not in ['vertical', 'horizontal']:
-                raise errors.HighchartsError(f'layout_starting_direction expects either '
-                                             f'"vertical" or "horizontal". Received: '
-                                             f'{value}')
-
-            self._layout_starting_direction = value
+        self._layout_starting_direction = utility_functions.validate_enum(
+            value,
+            constants.LAYOUT_STARTING_DIRECTION_VALUES,
+            'layout_starting_direction'
+        )
 
     @property
     def level_is_constant(self) -> Optional[bool]:
@@ -508,10 +444,7 @@ class TreemapOptions(GenericTypeOptions):
 
     @level_is_constant.setter
     def level_is_constant(self, value):
-        if value is None:
-            self._level_is_constant = None
-        else:
-            self._level_is_constant = bool(value)
+        self._level_is_constant = utility_functions.validate_bool(value)
 
     @property
     def levels(self) -> Optional[List[TreemapLevelOptions]]:
@@ -540,7 +473,7 @@ class TreemapOptions(GenericTypeOptions):
 
     @linecap.setter
     def linecap(self, value):
-        self._linecap = validators.string(value, allow_empty = True)
+        self._linecap = utility_functions.validate_string(value)
 
     @property
     def line_width(self) -> Optional[int | float | Decimal]:
@@ -552,9 +485,7 @@ class TreemapOptions(GenericTypeOptions):
 
     @line_width.setter
     def line_width(self, value):
-        self._line_width = validators.numeric(value,
-                                              allow_empty = True,
-                                              minimum = 0)
+        self._line_width = utility_functions.validate_numeric(value, minimum = 0)
 
     @property
     def negative_color(self) -> Optional[str | Gradient | Pattern]:
@@ -608,9 +539,7 @@ class TreemapOptions(GenericTypeOptions):
 
     @point_interval.setter
     def point_interval(self, value):
-        self._point_interval = validators.numeric(value,
-                                                  allow_empty = True,
-                                                  minimum = 0)
+        self._point_interval = utility_functions.validate_numeric(value, minimum = 0)
 
     @property
     def point_interval_unit(self) -> Optional[str]:
@@ -635,7 +564,7 @@ class TreemapOptions(GenericTypeOptions):
 
     @point_interval_unit.setter
     def point_interval_unit(self, value):
-        self._point_interval_unit = validators.string(value, allow_empty = True)
+        self._point_interval_unit = utility_functions.validate_string(value)
 
     @property
     def point_start(self) -> Optional[int | float | Decimal]:
@@ -656,7 +585,7 @@ class TreemapOptions(GenericTypeOptions):
 
     @point_start.setter
     def point_start(self, value):
-        self._point_start = validators.numeric(value, allow_empty = True)
+        self._point_start = utility_functions.validate_numeric(value)
 
     @property
     def relative_x_value(self) -> Optional[bool]:
@@ -678,10 +607,7 @@ class TreemapOptions(GenericTypeOptions):
 
     @relative_x_value.setter
     def relative_x_value(self, value):
-        if value is None:
-            self._relative_x_value = None
-        else:
-            self._relative_x_value = bool(value)
+        self._relative_x_value = utility_functions.validate_bool(value)
 
     @property
     def soft_threshold(self) -> Optional[bool]:
@@ -699,10 +625,7 @@ class TreemapOptions(GenericTypeOptions):
 
     @soft_threshold.setter
     def soft_threshold(self, value):
-        if value is None:
-            self._soft_threshold = None
-        else:
-            self._soft_threshold = bool(value)
+        self._soft_threshold = utility_functions.validate_bool(value)
 
     @property
     def sort_index(self) -> Optional[int]:
@@ -715,9 +638,7 @@ class TreemapOptions(GenericTypeOptions):
 
     @sort_index.setter
     def sort_index(self, value):
-        self._sort_index = validators.integer(value,
-                                              allow_empty = True,
-                                              minimum = 0)
+        self._sort_index = utility_functions.validate_integer(value, minimum = 0)
 
     @property
     def stacking(self) -> Optional[str]:
@@ -742,15 +663,9 @@ class TreemapOptions(GenericTypeOptions):
 
     @stacking.setter
     def stacking(self, value):
-        if not value:
-            self._stacking = None
-        else:
-            value = validators.string(value)
-            value = value.lower()
-            if value not in ['normal', 'percent', 'stream', 'overlap']:
-                raise errors.HighchartsValueError(f'stacking expects a valid stacking '
-                                                  f'value. However, received: {value}')
-            self._stacking = value
+        self._stacking = utility_functions.validate_enum(value,
+                                                         constants.STACKING_VALUES,
+                                                         'stacking')
 
     @property
     def step(self) -> Optional[str]:
@@ -769,7 +684,7 @@ class TreemapOptions(GenericTypeOptions):
 
     @step.setter
     def step(self, value):
-        self._step = validators.string(value, allow_empty = True)
+        self._step = utility_functions.validate_string(value)
 
     @property
     def zone_axis(self) -> Optional[str]:
@@ -781,7 +696,7 @@ class TreemapOptions(GenericTypeOptions):
 
     @zone_axis.setter
     def zone_axis(self, value):
-        self._zone_axis = validators.string(value, allow_empty = True)
+        self._zone_axis = utility_functions.validate_string(value)
 
     @property
     def zones(self) -> Optional[List[Zone]]:
@@ -806,124 +721,15 @@ class TreemapOptions(GenericTypeOptions):
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'accessibility': as_dict.get('accessibility', None),
-            'allow_point_select': as_dict.get('allowPointSelect', None),
-            'animation': as_dict.get('animation', None),
-            'class_name': as_dict.get('className', None),
-            'clip': as_dict.get('clip', None),
-            'color': as_dict.get('color', None),
-            'cursor': as_dict.get('cursor', None),
-            'custom': as_dict.get('custom', None),
-            'dash_style': as_dict.get('dashStyle', None),
-            'data_labels': as_dict.get('dataLabels', None),
-            'description': as_dict.get('description', None),
-            'enable_mouse_tracking': as_dict.get('enableMouseTracking', None),
-            'events': as_dict.get('events', None),
-            'include_in_data_export': as_dict.get('includeInDataExport', None),
-            'keys': as_dict.get('keys', None),
-            'label': as_dict.get('label', None),
-            'legend_symbol': as_dict.get('legendSymbol', None),
-            'linked_to': as_dict.get('linkedTo', None),
-            'marker': as_dict.get('marker', None),
-            'on_point': as_dict.get('onPoint', None),
-            'opacity': as_dict.get('opacity', None),
-            'point': as_dict.get('point', None),
-            'point_description_formatter': as_dict.get('pointDescriptionFormatter', None),
-            'selected': as_dict.get('selected', None),
-            'show_checkbox': as_dict.get('showCheckbox', None),
-            'show_in_legend': as_dict.get('showInLegend', None),
-            'skip_keyboard_navigation': as_dict.get('skipKeyboardNavigation', None),
-            'sonification': as_dict.get('sonification', None),
-            'states': as_dict.get('states', None),
-            'sticky_tracking': as_dict.get('stickyTracking', None),
-            'threshold': as_dict.get('threshold', None),
-            'tooltip': as_dict.get('tooltip', None),
-            'turbo_threshold': as_dict.get('turboThreshold', None),
-            'visible': as_dict.get('visible', None),
-
-            'animation_limit': as_dict.get('animationLimit', None),
-            'boost_blending': as_dict.get('boostBlending', None),
-            'boost_threshold': as_dict.get('boostThreshold', None),
-            'color_axis': as_dict.get('colorAxis', None),
-            'color_key': as_dict.get('colorKey', None),
-            'colors': as_dict.get('colors', None),
-            'crop_threshold': as_dict.get('cropThreshold', None),
-            'find_nearest_point_by': as_dict.get('findNearestPointBy', None),
-            'get_extremes_from_all': as_dict.get('getExtremesFromAll', None),
-            'inactive_other_points': as_dict.get('inactiveOtherPoints', None),
-            'ignore_hidden_point': as_dict.get('ignoreHiddenPoint', None),
-            'linecap': as_dict.get('linecap', None),
-            'line_width': as_dict.get('lineWidth', None),
-            'negative_color': as_dict.get('negativeColor', None),
-            'point_description_format': as_dict.get('pointDescriptionFormat', None),
-            'point_interval': as_dict.get('pointInterval', None),            'point_interval_unit': as_dict.get('pointIntervalUnit', None),
-            'point_start': as_dict.get('pointStart', None),
-            'relative_x_value': as_dict.get('relativeXValue', None),
-            'soft_threshold': as_dict.get('softThreshold', None),
-            'stacking': as_dict.get('stacking', None),
-            'step': as_dict.get('step', None),
-            'zone_axis': as_dict.get('zoneAxis', None),
-            'zones': as_dict.get('zones', None),
-
-            'color_index': as_dict.get('colorIndex', None),
-            'crisp': as_dict.get('crisp', None),
-            'allow_traversing_tree': as_dict.get('allowTraversingTree', None),
-            'breadcrumbs': as_dict.get('breadcrumbs', None),
-            'color_by_point': as_dict.get('colorByPoint', None),
-            'level_is_constant': as_dict.get('levelIsConstant', None),
-            'levels': as_dict.get('levels', None),
-
-            'alternate_starting_direction': as_dict.get('alternateStartingDirection',
-                                                        None),
-            'interact_by_leaf': as_dict.get('interactByLeaf', None),
-            'layout_algorithm': as_dict.get('layoutAlgorithm', None),
-            'layout_starting_direction': as_dict.get('layoutStartingDirection', None),
-            'sort_index': as_dict.get('sortIndex', None)
-        }
+        kwargs = super()._get_kwargs_from_dict(as_dict)
+
+        for name, key in TreemapOptions._KEY_MAP:
+            kwargs[name] = as_dict.get(key, None)
 
         return kwargs
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'allowTraversingTree': self.allow_traversing_tree,
-            'alternateStartingDirection': self.alternate_starting_direction,
-            'animationLimit': self.animation_limit,
-            'boostBlending': self.boost_blending,
-            'boostThreshold': self.boost_threshold,
-            'breadcrumbs': self.breadcrumbs,
-            'colorAxis': self.color_axis,
-            'colorByPoint': self.color_by_point,
-            'colorIndex': self.color_index,
-            'colorKey': self.color_key,
-            'colors': self.colors,
-            'crisp': self.crisp,
-            'cropThreshold': self.crop_threshold,
-            'findNearestPointBy': self.find_nearest_point_by,
-            'getExtremesFromAll': self.get_extremes_from_all,
-            'ignoreHiddenPoint': self.ignore_hidden_point,
-            'interactByLeaf': self.interact_by_leaf,
-            'layoutAlgorithm': self.layout_algorithm,
-            'layoutStartingDirection': self.layout_starting_direction,
-            'levelIsConstant': self.level_is_constant,
-            'levels': self.levels,
-            'linecap': self.linecap,
-            'lineWidth': self.line_width,
-            'negativeColor': self.negative_color,
-            'pointInterval': self.point_interval,
-            'pointIntervalUnit': self.point_interval_unit,
-            'pointStart': self.point_start,
-            'relativeXValue': self.relative_x_value,
-            'softThreshold': self.soft_threshold,
-            'sortIndex': self.sort_index,
-            'stacking': self.stacking,
-            'step': self.step,
-            'zoneAxis': self.zone_axis,
-            'zones': self.zones
-        }
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls)
-
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed = {key: getattr(self, name) for name, key in TreemapOptions._KEY_MAP}
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls))
 
         return untrimmed
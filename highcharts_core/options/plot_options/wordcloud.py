@@ -555,8 +555,6 @@ class WordcloudOptions(GenericTypeOptions):
             'spiral': self.spiral
         }
 
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls) or {}
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls) or {})
 
         return untrimmed
@@ -93,7 +93,7 @@ class BarData(CartesianData):
             self._dash_style = None
         else:
             value = validators.string(value)
-            if value not in constants.SUPPORTED_DASH_STYLE_VALUES:
+            if value not in constants._DASH_STYLE_SET:
                 raise errors.HighchartsValueError(f'dash_style expects a recognized value'
                                                   f', but received: {value}')
             self._dash_style = value
@@ -182,9 +182,7 @@ class BarData(CartesianData):
             'pointWidth': self.point_width,
         }
 
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls) or {}
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls) or {})
 
         return untrimmed
 
@@ -322,9 +320,7 @@ class WaterfallData(CartesianData):
             'isSum': self.is_sum,
         }
 
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls) or {}
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls) or {})
 
         return untrimmed
 
@@ -578,9 +574,7 @@ class WindBarbData(CartesianData):
             'value': self.value,
         }
 
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls) or {}
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls) or {})
 
         return untrimmed
 
@@ -788,9 +782,7 @@ class XRangeData(CartesianData):
             'x2': self.x2,
         }
 
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls) or {}
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls) or {})
 
         return untrimmed
 
@@ -62,7 +62,7 @@ class BoxPlotData(CartesianData):
             self._box_dash_style = None
         else:
             value = validators.string(value)
-            if value not in constants.SUPPORTED_DASH_STYLE_VALUES:
+            if value not in constants._DASH_STYLE_SET:
                 raise errors.HighchartsValueError(f'box_dash_style expects a recognized '
                                                   f'value, but received: {value}')
             self._box_dash_style = value
@@ -134,7 +134,7 @@ class BoxPlotData(CartesianData):
             self._median_dash_style = None
         else:
             value = validators.string(value)
-            if value not in constants.SUPPORTED_DASH_STYLE_VALUES:
+            if value not in constants._DASH_STYLE_SET:
                 raise errors.HighchartsValueError(f'median_dash_style expects a '
                                                   f'recognized value, but received: '
                                                   f'{value}')
@@ -195,7 +195,7 @@ class BoxPlotData(CartesianData):
             self._stem_dash_style = None
         else:
             value = validators.string(value)
-            if value not in constants.SUPPORTED_DASH_STYLE_VALUES:
+            if value not in constants._DASH_STYLE_SET:
                 raise errors.HighchartsValueError(f'stem_dash_style expects a recognized'
                                                   f' value, but received: {value}')
             self._stem_dash_style = value
@@ -228,7 +228,7 @@ class BoxPlotData(CartesianData):
             self._whisker_dash_style = None
         else:
             value = validators.string(value)
-            if value not in constants.SUPPORTED_DASH_STYLE_VALUES:
+            if value not in constants._DASH_STYLE_SET:
                 raise errors.HighchartsValueError(f'whisker_dash_style expects a '
                                                   f'recognized value, but received: '
                                                   f'{value}')
@@ -446,9 +446,7 @@ class BoxPlotData(CartesianData):
             'whiskerDashStyle': self.whisker_dash_style,
         }
 
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls) or {}
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls) or {})
 
         return untrimmed
 
@@ -295,9 +295,7 @@ class ConnectionData(ConnectionBase):
             'dragDrop': self.drag_drop,
         }
 
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls) or {}
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls) or {})
 
         return untrimmed
 
@@ -596,9 +594,7 @@ class OutgoingWeightedConnectionData(WeightedConnectionData):
             'outgoing': self.outgoing
         }
 
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls) or {}
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls) or {})
 
         return untrimmed
 
@@ -372,8 +372,6 @@ class Funnel3DSeries(PieSeries, FunnelOptions):
             'data': self.data,
             'gradientForSides': self.gradient_for_sides
         }
-        parent_as_dict = mro__to_untrimmed_dict(self, in_cls = in_cls)
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(mro__to_untrimmed_dict(self, in_cls = in_cls))
 
         return untrimmed
@@ -157,9 +157,6 @@ class ParetoSeries(SeriesBase, ParetoOptions):
         untrimmed = {
             'baseSeries': self.base_series
         }
-        parent_as_dict = mro__to_untrimmed_dict(self, in_cls = in_cls) or {}
-
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(mro__to_untrimmed_dict(self, in_cls = in_cls) or {})
 
         return untrimmed
@@ -296,8 +296,6 @@ class PictorialSeries(SeriesBase, PictorialOptions):
         untrimmed = {
             'paths': self.paths
         }
-        parent_as_dict = mro__to_untrimmed_dict(self, in_cls = in_cls)
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(mro__to_untrimmed_dict(self, in_cls = in_cls))
 
         return untrimmed
@@ -367,9 +367,6 @@ class VariablePieSeries(PieSeries):
             'zMax': self.z_max,
             'zMin': self.z_min
         }
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls)
-
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls))
 
         return untrimmed
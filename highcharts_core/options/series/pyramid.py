@@ -225,8 +225,6 @@ class Pyramid3DSeries(PyramidOptions, PieSeries):
             'colorKey': self.color_key,
             'linecap': self.linecap
         }
-        parent_as_dict = mro__to_untrimmed_dict(self, in_cls = in_cls)
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(mro__to_untrimmed_dict(self, in_cls = in_cls))
 
         return untrimmed
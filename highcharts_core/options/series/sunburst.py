@@ -3,7 +3,7 @@ from typing import Optional, List
 from highcharts_core.options.series.base import SeriesBase
 from highcharts_core.options.series.data.sunburst import SunburstData, SunburstDataCollection
 from highcharts_core.options.plot_options.sunburst import SunburstOptions
-from highcharts_core.utility_functions import mro__to_untrimmed_dict, is_ndarray
+from highcharts_core.utility_functions import is_ndarray
 
 
 class SunburstSeries(SeriesBase, SunburstOptions):
@@ -70,102 +70,14 @@ class SunburstSeries(SeriesBase, SunburstOptions):
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'accessibility': as_dict.get('accessibility', None),
-            'allow_point_select': as_dict.get('allowPointSelect', None),
-            'animation': as_dict.get('animation', None),
-            'class_name': as_dict.get('className', None),
-            'clip': as_dict.get('clip', None),
-            'color': as_dict.get('color', None),
-            'cursor': as_dict.get('cursor', None),
-            'custom': as_dict.get('custom', None),
-            'dash_style': as_dict.get('dashStyle', None),
-            'data_labels': as_dict.get('dataLabels', None),
-            'description': as_dict.get('description', None),
-            'enable_mouse_tracking': as_dict.get('enableMouseTracking', None),
-            'events': as_dict.get('events', None),
-            'include_in_data_export': as_dict.get('includeInDataExport', None),
-            'keys': as_dict.get('keys', None),
-            'label': as_dict.get('label', None),
-            'legend_symbol': as_dict.get('legendSymbol', None),
-            'linked_to': as_dict.get('linkedTo', None),
-            'marker': as_dict.get('marker', None),
-            'on_point': as_dict.get('onPoint', None),
-            'opacity': as_dict.get('opacity', None),
-            'point': as_dict.get('point', None),
-            'point_description_formatter': as_dict.get('pointDescriptionFormatter', None),
-            'selected': as_dict.get('selected', None),
-            'show_checkbox': as_dict.get('showCheckbox', None),
-            'show_in_legend': as_dict.get('showInLegend', None),
-            'skip_keyboard_navigation': as_dict.get('skipKeyboardNavigation', None),
-            'sonification': as_dict.get('sonification', None),
-            'states': as_dict.get('states', None),
-            'sticky_tracking': as_dict.get('stickyTracking', None),
-            'threshold': as_dict.get('threshold', None),
-            'tooltip': as_dict.get('tooltip', None),
-            'turbo_threshold': as_dict.get('turboThreshold', None),
-            'visible': as_dict.get('visible', None),
-
-            'animation_limit': as_dict.get('animationLimit', None),
-            'boost_blending': as_dict.get('boostBlending', None),
-            'boost_threshold': as_dict.get('boostThreshold', None),
-            'color_axis': as_dict.get('colorAxis', None),
-            'color_index': as_dict.get('colorIndex', None),
-            'color_key': as_dict.get('colorKey', None),
-            'connect_ends': as_dict.get('connectEnds', None),
-            'connect_nulls': as_dict.get('connectNulls', None),
-            'crisp': as_dict.get('crisp', None),
-            'crop_threshold': as_dict.get('cropThreshold', None),
-            'data_sorting': as_dict.get('dataSorting', None),
-            'drag_drop': as_dict.get('dragDrop', None),
-            'find_nearest_point_by': as_dict.get('findNearestPointBy', None),
-            'get_extremes_from_all': as_dict.get('getExtremesFromAll', None),
-            'inactive_other_points': as_dict.get('inactiveOtherPoints', None),
-            'linecap': as_dict.get('linecap', None),
-            'line_width': as_dict.get('lineWidth', None),
-            'negative_color': as_dict.get('negativeColor', None),
-            'point_description_format': as_dict.get('pointDescriptionFormat', None),
-            'point_interval': as_dict.get('pointInterval', None),
-            'point_interval_unit': as_dict.get('pointIntervalUnit', None),
-            'point_placement': as_dict.get('pointPlacement', None),
-            'point_start': as_dict.get('pointStart', None),
-            'relative_x_value': as_dict.get('relativeXValue', None),
-            'shadow': as_dict.get('shadow', None),
-            'soft_threshold': as_dict.get('softThreshold', None),
-            'stacking': as_dict.get('stacking', None),
-            'step': as_dict.get('step', None),
-            'zone_axis': as_dict.get('zoneAxis', None),
-            'zones': as_dict.get('zones', None),
-
-            'data': as_dict.get('data', None),
-            'id': as_dict.get('id', None),
-            'index': as_dict.get('index', None),
-            'legend_index': as_dict.get('legendIndex', None),
-            'name': as_dict.get('name', None),
-            'stack': as_dict.get('stack', None),
-            'x_axis': as_dict.get('xAxis', None),
-            'y_axis': as_dict.get('yAxis', None),
-            'z_index': as_dict.get('zIndex', None),
-
-            'allow_traversing_tree': as_dict.get('allowTraversingTree', None),
-            'border_color': as_dict.get('borderColor', None),
-            'border_width': as_dict.get('borderWidth', None),
-            'breadcrumbs': as_dict.get('breadcrumbs', None),
-            'center': as_dict.get('center', None),
-            'color_by_point': as_dict.get('colorByPoint', None),
-            'fill_color': as_dict.get('fillColor', None),
-            'level_is_constant': as_dict.get('levelIsConstant', None),
-            'levels': as_dict.get('levels', None),
-            'level_size': as_dict.get('levelSize', None),
-            'root_id': as_dict.get('rootId', None),
-            'size': as_dict.get('size', None),
-            'sliced_offset': as_dict.get('slicedOffset', None),
-            'start_angle': as_dict.get('startAngle', None)
-        }
+        kwargs = super()._get_kwargs_from_dict(as_dict)
+        kwargs.update(SunburstOptions._get_kwargs_from_dict(as_dict))
 
         return kwargs
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = mro__to_untrimmed_dict(self, in_cls = in_cls)
+        # SeriesBase._to_untrimmed_dict() chains through super() across the full MRO
+        # (including SunburstOptions), so one call already collects every ancestor's keys.
+        untrimmed = super()._to_untrimmed_dict(in_cls = in_cls)
 
         return untrimmed
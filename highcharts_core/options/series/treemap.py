@@ -3,7 +3,7 @@ from typing import Optional, List
 from highcharts_core.options.series.base import SeriesBase
 from highcharts_core.options.series.data.treemap import TreemapData, TreemapDataCollection
 from highcharts_core.options.plot_options.treemap import TreemapOptions
-from highcharts_core.utility_functions import mro__to_untrimmed_dict, is_ndarray
+from highcharts_core.utility_functions import is_ndarray
 
 
 class TreemapSeries(SeriesBase, TreemapOptions):
@@ -159,6 +159,8 @@ class TreemapSeries(SeriesBase, TreemapOptions):
         return kwargs
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = mro__to_untrimmed_dict(self, in_cls = in_cls) or {}
+        # SeriesBase._to_untrimmed_dict() chains through super() across the full MRO
+        # (including TreemapOptions), so one call already collects every ancestor's keys.
+        untrimmed = super()._to_untrimmed_dict(in_cls = in_cls)
 
         return untrimmed
@@ -409,10 +409,7 @@ class InstrumentTrackConfiguration(TrackConfigurationBase):
             'roundToMusicalNotes': self.round_to_musical_notes,
         }
 
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls)
-
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls))
 
         return untrimmed
 
@@ -482,10 +479,7 @@ class SpeechTrackConfiguration(TrackConfigurationBase):
             'preferredVoice': self.preferred_voice,
         }
 
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls)
-
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls))
 
         return untrimmed
 
@@ -632,9 +626,6 @@ class ContextTrackConfiguration(InstrumentTrackConfiguration, SpeechTrackConfigu
             'valueProp': self.value_prop,
         }
 
-        parent_as_dict = mro__to_untrimmed_dict(self, in_cls = in_cls)
-
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(mro__to_untrimmed_dict(self, in_cls = in_cls))
 
         return untrimmed
\ No newline at end of file
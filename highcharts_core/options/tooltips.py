@@ -1065,8 +1065,6 @@ class DiagramTooltip(Tooltip):
             'nodeFormatter': self.node_formatter,
         }
 
-        parent_as_dict = super()._to_untrimmed_dict(in_cls=in_cls) or {}
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls=in_cls) or {})
 
         return untrimmed
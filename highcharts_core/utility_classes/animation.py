@@ -1,7 +1,6 @@
 from typing import Optional
 
-from validator_collection import validators
-
+from highcharts_core import utility_functions
 from highcharts_core.decorators import class_sensitive
 from highcharts_core.metaclasses import HighchartsMeta
 from highcharts_core.utility_classes.javascript_functions import CallbackFunction
@@ -18,18 +17,23 @@ class AnimationOptions(HighchartsMeta):
 
     """
 
+    _KEY_MAP = (
+        ('complete', 'complete'),
+        ('defer', 'defer'),
+        ('duration', 'duration'),
+        ('easing', 'easing'),
+        ('step', 'step'),
+    )
+    _DEFAULTS = dict.fromkeys('_' + name for name, _ in _KEY_MAP)
+
     def __init__(self, **kwargs):
-        self._complete = None
-        self._defer = None
-        self._duration = None
-        self._easing = None
-        self._step = None
-
-        self.complete = kwargs.get('complete', None)
-        self.defer = kwargs.get('defer', None)
-        self.duration = kwargs.get('duration', None)
-        self.easing = kwargs.get('easing', None)
-        self.step = kwargs.get('step', None)
+        self.__dict__.update(AnimationOptions._DEFAULTS)
+
+        get_kwarg = kwargs.get
+        for name, _ in AnimationOptions._KEY_MAP:
+            value = get_kwarg(name)
+            if value is not None:
+                setattr(self, name, value)
 
     @property
     def complete(self) -> Optional[CallbackFunction]:
@@ -56,10 +60,9 @@ class AnimationOptions(HighchartsMeta):
 
     @defer.setter
     def defer(self, value):
-        self._defer = validators.integer(value,
-                                         allow_empty = True,
-                                         minimum = 0,
-                                         coerce_value = True)
+        self._defer = utility_functions.validate_integer(value,
+                                                         minimum = 0,
+                                                         coerce_value = True)
 
     @property
     def duration(self) -> Optional[int]:
@@ -73,10 +76,9 @@ class AnimationOptions(HighchartsMeta):
 
     @duration.setter
     def duration(self, value):
-        self._duration = validators.integer(value,
-                                            allow_empty = True,
-                                            minimum = 0,
-                                            coerce_value = True)
+        self._duration = utility_functions.validate_integer(value,
+                                                            minimum = 0,
+                                                            coerce_value = True)
 
     @property
     def easing(self) -> Optional[str]:
@@ -88,7 +90,7 @@ class AnimationOptions(HighchartsMeta):
 
     @easing.setter
     def easing(self, value):
-        self._easing = validators.string(value, allow_empty = True)
+        self._easing = utility_functions.validate_string(value)
 
     @property
     def step(self) -> Optional[CallbackFunction]:
@@ -108,22 +110,12 @@ class AnimationOptions(HighchartsMeta):
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'complete': as_dict.get('complete', None),
-            'defer': as_dict.get('defer', None),
-            'duration': as_dict.get('duration', None),
-            'easing': as_dict.get('easing', None),
-            'step': as_dict.get('step', None)
-        }
+        get_value = as_dict.get
+        kwargs = {name: get_value(key, None) for name, key in AnimationOptions._KEY_MAP}
+
         return kwargs
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'complete': self.complete,
-            'defer': self.defer,
-            'duration': self.duration,
-            'easing': self.easing,
-            'step': self.step
-        }
+        untrimmed = {key: getattr(self, name) for name, key in AnimationOptions._KEY_MAP}
 
         return untrimmed
@@ -1,9 +1,7 @@
 from typing import Optional
 from decimal import Decimal
 
-from validator_collection import validators
-
-from highcharts_core import errors
+from highcharts_core import errors, utility_functions
 from highcharts_core.decorators import class_sensitive, validate_types
 from highcharts_core.metaclasses import HighchartsMeta
 from highcharts_core.utility_classes.animation import AnimationOptions
@@ -14,6 +12,14 @@ from highcharts_core.utility_classes.patterns import Pattern
 class HoverState(HighchartsMeta):
     """Options for the hovered point/series."""
 
+    _KEY_MAP = (
+        ('animation', 'animation'),
+        ('border_color', 'borderColor'),
+        ('brightness', 'brightness'),
+        ('color', 'color'),
+        ('enabled', 'enabled'),
+    )
+
     def __init__(self, **kwargs):
         self._animation = None
         self._border_color = None
@@ -52,7 +58,6 @@ class HoverState(HighchartsMeta):
 
     @border_color.setter
     def border_color(self, value):
-        from highcharts_core import utility_functions
         self._border_color = utility_functions.validate_color(value)
 
     @property
@@ -67,7 +72,7 @@ class HoverState(HighchartsMeta):
 
     @brightness.setter
     def brightness(self, value):
-        self._brightness = validators.numeric(value, allow_empty = True)
+        self._brightness = utility_functions.validate_numeric(value)
 
     @property
     def color(self) -> Optional[str | Gradient | Pattern]:
@@ -80,21 +85,8 @@ class HoverState(HighchartsMeta):
 
     @color.setter
     def color(self, value):
-        from highcharts_core import utility_functions
         self._color = utility_functions.validate_color(value)
 
-    @property
-    def color(self) -> Optional[str]:
-        """A specific color for the hovered point.
-
-        :rtype: :class:`str <python:str>` or :obj:`None <python:None>`
-        """
-        return self._color
-
-    @color.setter
-    def color(self, value):
-        self._color = validators.string(value, allow_empty = True)
-
     @property
     def enabled(self) -> Optional[bool]:
         """Enable separate styles for the hovered series to visualize that the user hovers
@@ -106,31 +98,17 @@ class HoverState(HighchartsMeta):
 
     @enabled.setter
     def enabled(self, value):
-        if value is None:
-            self._enabled = None
-        else:
-            self._enabled = bool(value)
+        self._enabled = utility_functions.validate_bool(value)
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'animation': as_dict.get('animation', None),
-            'border_color': as_dict.get('borderColor', None),
-            'brightness': as_dict.get('brightness', None),
-            'color': as_dict.get('color', None),
-            'enabled': as_dict.get('enabled', None)
-        }
+        get_value = as_dict.get
+        kwargs = {name: get_value(key, None) for name, key in HoverState._KEY_MAP}
 
         return kwargs
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'animation': self.animation,
-            'borderColor': self.border_color,
-            'brightness': self.brightness,
-            'color': self.color,
-            'enabled': self.enabled
-        }
+        untrimmed = {key: getattr(self, name) for name, key in HoverState._KEY_MAP}
 
         return untrimmed
 
@@ -138,6 +116,12 @@ class HoverState(HighchartsMeta):
 class InactiveState(HighchartsMeta):
     """Options for the oppositive of a hovered point/series."""
 
+    _KEY_MAP = (
+        ('animation', 'animation'),
+        ('enabled', 'enabled'),
+        ('opacity', 'opacity'),
+    )
+
     def __init__(self, **kwargs):
         self._animation = None
         self._enabled = None
@@ -170,10 +154,7 @@ class InactiveState(HighchartsMeta):
 
     @enabled.setter
     def enabled(self, value):
-        if value is None:
-            self._enabled = None
-        else:
-            self._enabled = bool(value)
+        self._enabled = utility_functions.validate_bool(value)
 
     @property
     def opacity(self) -> Optional[int | float | Decimal]:
@@ -185,24 +166,17 @@ class InactiveState(HighchartsMeta):
 
     @opacity.setter
     def opacity(self, value):
-        self._opacity = validators.numeric(value, allow_empty = True)
+        self._opacity = utility_functions.validate_numeric(value)
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'animation': as_dict.get('animation', None),
-            'enabled': as_dict.get('enabled', None),
-            'opacity': as_dict.get('opacity', None)
-        }
+        get_value = as_dict.get
+        kwargs = {name: get_value(key, None) for name, key in InactiveState._KEY_MAP}
 
         return kwargs
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'animation': self.animation,
-            'enabled': self.enabled,
-            'opacity': self.opacity
-        }
+        untrimmed = {key: getattr(self, name) for name, key in InactiveState._KEY_MAP}
 
         return untrimmed
 
@@ -210,6 +184,10 @@ class InactiveState(HighchartsMeta):
 class NormalState(HighchartsMeta):
     """Options for returning to a normal state after hovering"""
 
+    _KEY_MAP = (
+        ('animation', 'animation'),
+    )
+
     def __init__(self, **kwargs):
         self._animation = None
 
@@ -227,7 +205,10 @@ class NormalState(HighchartsMeta):
 
     @animation.setter
     def animation(self, value):
-        if isinstance(value, bool):
+        if value is None or isinstance(value, bool):
+            self._animation = value
+        elif type(value) is AnimationOptions and value:
+            # Same short-circuit class_sensitive() applies to populated instances.
             self._animation = value
         else:
             self._animation = validate_types(value,
@@ -235,16 +216,13 @@ class NormalState(HighchartsMeta):
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'animation': as_dict.get('animation', None)
-        }
+        get_value = as_dict.get
+        kwargs = {name: get_value(key, None) for name, key in NormalState._KEY_MAP}
 
         return kwargs
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'animation': self.animation
-        }
+        untrimmed = {key: getattr(self, name) for name, key in NormalState._KEY_MAP}
 
         return untrimmed
 
@@ -253,6 +231,13 @@ class SelectState(HighchartsMeta):
     """Options for the selected point. These settings override the normal state options
     when a point is selected."""
 
+    _KEY_MAP = (
+        ('animation', 'animation'),
+        ('border_color', 'borderColor'),
+        ('color', 'color'),
+        ('enabled', 'enabled'),
+    )
+
     def __init__(self, **kwargs):
         self._animation = None
         self._border_color = None
@@ -288,7 +273,6 @@ class SelectState(HighchartsMeta):
 
     @border_color.setter
     def border_color(self, value):
-        from highcharts_core import utility_functions
         self._border_color = utility_functions.validate_color(value)
 
     @property
@@ -302,7 +286,6 @@ class SelectState(HighchartsMeta):
 
     @color.setter
     def color(self, value):
-        from highcharts_core import utility_functions
         self._color = utility_functions.validate_color(value)
 
     @property
@@ -316,29 +299,17 @@ class SelectState(HighchartsMeta):
 
     @enabled.setter
     def enabled(self, value):
-        if value is None:
-            self._enabled = None
-        else:
-            self._enabled = bool(value)
+        self._enabled = utility_functions.validate_bool(value)
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'animation': as_dict.get('animation', None),
-            'border_color': as_dict.get('borderColor', None),
-            'color': as_dict.get('color', None),
-            'enabled': as_dict.get('enabled', None),
-        }
+        get_value = as_dict.get
+        kwargs = {name: get_value(key, None) for name, key in SelectState._KEY_MAP}
 
         return kwargs
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'animation': self.animation,
-            'borderColor': self.border_color,
-            'color': self.color,
-            'enabled': self.enabled
-        }
+        untrimmed = {key: getattr(self, name) for name, key in SelectState._KEY_MAP}
 
         return untrimmed
 
@@ -347,6 +318,13 @@ class States(HighchartsMeta):
     """Collection of state configuration settings that can be applied to series or
     markers."""
 
+    _KEY_MAP = (
+        ('hover', 'hover'),
+        ('inactive', 'inactive'),
+        ('normal', 'normal'),
+        ('select', 'select'),
+    )
+
     def __init__(self, **kwargs):
         self._hover = None
         self._inactive = None
@@ -423,21 +401,12 @@ class States(HighchartsMeta):
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'hover': as_dict.get('hover', None),
-            'inactive': as_dict.get('inactive', None),
-            'normal': as_dict.get('normal', None),
-            'select': as_dict.get('select', None)
-        }
+        get_value = as_dict.get
+        kwargs = {name: get_value(key, None) for name, key in States._KEY_MAP}
 
         return kwargs
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'hover': self.hover,
-            'inactive': self.inactive,
-            'normal': self.normal,
-            'select': self.select
-        }
+        untrimmed = {key: getattr(self, name) for name, key in States._KEY_MAP}
 
         return untrimmed
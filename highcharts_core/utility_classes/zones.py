@@ -3,7 +3,7 @@ from decimal import Decimal
 
 from validator_collection import validators
 
-from highcharts_core import constants, errors
+from highcharts_core import constants, errors, utility_functions
 from highcharts_core.decorators import class_sensitive
 from highcharts_core.metaclasses import HighchartsMeta
 from highcharts_core.utility_classes.gradients import Gradient
@@ -19,18 +19,23 @@ class Zone(HighchartsMeta):
 
     """
 
+    _KEY_MAP = (
+        ('class_name', 'className'),
+        ('color', 'color'),
+        ('dash_style', 'dashStyle'),
+        ('fill_color', 'fillColor'),
+        ('value', 'value'),
+    )
+    _DEFAULTS = dict.fromkeys('_' + name for name, _ in _KEY_MAP)
+
     def __init__(self, **kwargs):
-        self._class_name = None
-        self._color = None
-        self._dash_style = None
-        self._fill_color = None
-        self._value = None
+        self.__dict__.update(Zone._DEFAULTS)
 
-        self.class_name = kwargs.get('class_name', None)
-        self.color = kwargs.get('color', None)
-        self.dash_style = kwargs.get('dash_style', None)
-        self.fill_color = kwargs.get('fill_color', None)
-        self.value = kwargs.get('value', None)
+        get_kwarg = kwargs.get
+        for name, _ in Zone._KEY_MAP:
+            value = get_kwarg(name)
+            if value is not None:
+                setattr(self, name, value)
 
     @property
     def class_name(self) -> Optional[str]:
@@ -46,7 +51,7 @@ class Zone(HighchartsMeta):
 
     @class_name.setter
     def class_name(self, value):
-        self._class_name = validators.string(value, allow_empty = True)
+        self._class_name = utility_functions.validate_string(value)
 
     @property
     def color(self) -> Optional[str | Gradient | Pattern]:
@@ -59,7 +64,6 @@ class Zone(HighchartsMeta):
 
     @color.setter
     def color(self, value):
-        from highcharts_core import utility_functions
         self._color = utility_functions.validate_color(value)
 
     @property
@@ -91,7 +95,7 @@ class Zone(HighchartsMeta):
             self._dash_style = None
         else:
             value = validators.string(value)
-            if value not in constants.SUPPORTED_DASH_STYLE_VALUES:
+            if value not in constants._DASH_STYLE_SET:
                 raise errors.HighchartsValueError(f'dash_style expects a recognized value'
                                                   f', but received: {value}')
             self._dash_style = value
@@ -106,7 +110,6 @@ class Zone(HighchartsMeta):
 
     @fill_color.setter
     def fill_color(self, value):
-        from highcharts_core import utility_functions
         self._fill_color = utility_functions.validate_color(value)
 
     @property
@@ -124,24 +127,13 @@ class Zone(HighchartsMeta):
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'class_name': as_dict.get('className', None),
-            'color': as_dict.get('color', None),
-            'dash_style': as_dict.get('dashStyle', None),
-            'fill_color': as_dict.get('fillColor', None),
-            'value': as_dict.get('value', None)
-        }
+        get_value = as_dict.get
+        kwargs = {name: get_value(key, None) for name, key in Zone._KEY_MAP}
 
         return kwargs
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'className': self.class_name,
-            'color': self.color,
-            'dashStyle': self.dash_style,
-            'fillColor': self.fill_color,
-            'value': self.value
-        }
+        untrimmed = {key: getattr(self, name) for name, key in Zone._KEY_MAP}
 
         return untrimmed
 
@@ -174,7 +166,7 @@ class ClusterZone(HighchartsMeta):
 
     @class_name.setter
     def class_name(self, value):
-        self._class_name = validators.string(value, allow_empty = True)
+        self._class_name = utility_functions.validate_string(value)
 
     @property
     def from_(self) -> Optional[int | float | Decimal]:
@@ -140,40 +140,48 @@ def validate_color(value):
     :rtype: :class:`str <python:str>`, :class:`Gradient`, :class:`Pattern``, or
       :obj:`None <python:None>`
     """
+    if not value:
+        return None
+    elif isinstance(value, str) and not ('linearGradient' in value or
+                                         'radialGradient' in value or
+                                         'pattern' in value):
+        # Only strings naming a gradient or pattern (as JSON or a file path) are
+        # passed to from_json() below, so any other string is a plain color.
+        return value
+
     from highcharts_core.utility_classes.gradients import Gradient
     from highcharts_core.utility_classes.patterns import Pattern
 
-    if not value:
-        return None
-    elif value.__class__.__name__ == 'EnforcedNullType':
+    if value.__class__.__name__ == 'EnforcedNullType':
         return value
     elif isinstance(value, (Gradient, Pattern)):
         return value
-    elif isinstance(value, (dict, str)) and ('linearGradient' in value or
-                                             'radialGradient' in value):
-        try:
-            value = Gradient.from_json(value)
-        except (TypeError, ValueError):
-            if isinstance(value, dict):
-                value = Gradient.from_dict(value)
-            else:
+    elif isinstance(value, dict):
+        if 'linearGradient' in value or 'radialGradient' in value:
+            value = Gradient.from_dict(value)
+        elif 'linear_gradient' in value or 'radial_gradient' in value:
+            value = Gradient(**value)
+        elif 'patternOptions' in value or 'pattern' in value:
+            value = Pattern.from_dict(value)
+        elif 'pattern_options' in value:
+            value = Pattern(**value)
+        else:
+            raise errors.HighchartsValueError(f'Unable to resolve value to a string, '
+                                              f'Gradient, or Pattern. Value received '
+                                              f'was: {value}')
+    elif isinstance(value, str):
+        if 'linearGradient' in value or 'radialGradient' in value:
+            try:
+                value = Gradient.from_json(value)
+            except (TypeError, ValueError):
                 value = validators.string(value)
-    elif isinstance(value, dict) and ('linear_gradient' in value or
-                                      'radial_gradient' in value):
-        value = Gradient(**value)
-    elif isinstance(value, (dict, str)) and ('patternOptions' in value or
-                                             'pattern' in value):
-        try:
-            value = Pattern.from_json(value)
-        except (TypeError, ValueError):
-            if isinstance(value, dict):
-                value = Pattern.from_dict(value)
-            else:
+        elif 'patternOptions' in value or 'pattern' in value:
+            try:
+                value = Pattern.from_json(value)
+            except (TypeError, ValueError):
                 value = validators.string(value)
-    elif isinstance(value, dict) and 'pattern_options' in value:
-        value = Pattern(**value)
-    elif isinstance(value, str):
-        value = validators.string(value)
+        else:
+            value = validators.string(value)
     else:
         raise errors.HighchartsValueError(f'Unable to resolve value to a string, '
                                           f'Gradient, or Pattern. Value received '
@@ -182,6 +190,130 @@ def validate_color(value):
     return value
 
 
+def validate_numeric(value, minimum = None):
+    """Validate that ``value`` is numeric (or empty), returning it unchanged when it is
+    already an :class:`int <python:int>` or :class:`float <python:float>` that satisfies
+    ``minimum``.
+
+    Any other value is delegated to
+    :func:`validators.numeric() <validator_collection.validators.numeric>`, which coerces
+    it or raises the appropriate error.
+
+    :param value: The value to validate.
+
+    :param minimum: If supplied, the minimum value that ``value`` may hold. Defaults to
+      :obj:`None <python:None>`.
+    :type minimum: numeric or :obj:`None <python:None>`
+
+    :returns: The validated value.
+    :rtype: numeric or :obj:`None <python:None>`
+    """
+    if value is None:
+        return None
+
+    value_type = type(value)
+    if (value_type is int or value_type is float) and (minimum is None or
+                                                        value >= minimum):
+        return value
+
+    return validators.numeric(value, allow_empty = True, minimum = minimum)
+
+def validate_integer(value, minimum = None, coerce_value = False):
+    """Validate that ``value`` is an integer (or empty), returning it unchanged when it
+    is already an :class:`int <python:int>` that satisfies ``minimum``.
+
+    Any other value is delegated to
+    :func:`validators.integer() <validator_collection.validators.integer>`, which
+    raises the appropriate error.
+
+    :param value: The value to validate.
+
+    :param minimum: If supplied, the minimum value that ``value`` may hold. Defaults to
+      :obj:`None <python:None>`.
+    :type minimum: :class:`int <python:int>` or :obj:`None <python:None>`
+
+    :param coerce_value: If ``True``, non-integer numeric values are coerced to an
+      :class:`int <python:int>` rather than raising an error. Defaults to ``False``.
+    :type coerce_value: :class:`bool <python:bool>`
+
+    :returns: The validated value.
+    :rtype: :class:`int <python:int>` or :obj:`None <python:None>`
+    """
+    if value is None:
+        return None
+
+    if type(value) is int and (minimum is None or value >= minimum):
+        return value
+
+    return validators.integer(value,
+                              allow_empty = True,
+                              minimum = minimum,
+                              coerce_value = coerce_value)
+
+def validate_string(value):
+    """Validate that ``value`` is a :class:`str <python:str>` (or empty), returning it
+    unchanged when it is already a non-empty :class:`str <python:str>`.
+
+    Any other value is delegated to
+    :func:`validators.string() <validator_collection.validators.string>`, which raises
+    the appropriate error.
+
+    :param value: The value to validate.
+
+    :returns: The validated value.
+    :rtype: :class:`str <python:str>` or :obj:`None <python:None>`
+    """
+    if not value:
+        return None
+    if isinstance(value, str):
+        return value
+
+    return validators.string(value, allow_empty = True)
+
+def validate_enum(value, allowed, name):
+    """Validate that ``value`` is one of the ``allowed`` strings, ignoring case.
+
+    :param value: The value to validate.
+
+    :param allowed: The (lower-case) values that ``value`` may take.
+    :type allowed: :class:`frozenset <python:frozenset>`
+
+    :param name: The name of the option being validated, used in the error message.
+    :type name: :class:`str <python:str>`
+
+    :returns: The validated value, lower-cased if it did not already match.
+    :rtype: :class:`str <python:str>` or :obj:`None <python:None>`
+
+    :raises HighchartsValueError: if ``value`` is not one of ``allowed``
+    """
+    if not value:
+        return None
+    if not isinstance(value, str):
+        value = validators.string(value)
+    if value not in allowed:
+        value = value.lower()
+        if value not in allowed:
+            raise errors.HighchartsValueError(f'{name} expects one of '
+                                              f'{", ".join(sorted(allowed))}. '
+                                              f'Received: "{value}"')
+
+    return value
+
+def validate_bool(value):
+    """Coerce ``value`` to a :class:`bool <python:bool>`, preserving
+    :obj:`None <python:None>`.
+
+    :param value: The value to coerce.
+
+    :returns: :obj:`None <python:None>` if ``value`` is :obj:`None <python:None>`,
+      otherwise the truthiness of ``value``.
+    :rtype: :class:`bool <python:bool>` or :obj:`None <python:None>`
+    """
+    if value is None or value is True or value is False:
+        return value
+
+    return bool(value)
+
 def to_camelCase(snake_case):
     """Convert ``snake_case`` to ``camelCase``.
 
@@ -643,6 +643,9 @@ STANDARD_PARAMS = [
       'turbo_threshold': 456,
       'visible': True
     }, None),
+    ({
+      'border_radius': 3
+    }, None),
 
 ]
 
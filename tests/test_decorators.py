@@ -227,6 +227,8 @@ def test_validate_types_list(kwargs, error, result_class):
     ({ 'prop': 123 }, None, TestClass),
     # json
     ('{ "prop": 123 }', None, TestClass),
+    # instance
+    (TestClass(prop = 123), None, TestClass),
     # none
     (None, None, TestClass),
     # list and fails
@@ -270,3 +272,20 @@ def test_class_sensitive_list(value, error, result_class):
     else:
         with pytest.raises(error):
             test_instance.list_prop = value
+
+
+@pytest.mark.parametrize('types, error', [
+    (TestClass, None),
+    ([TestClass], None),
+
+    (None, errors.HighchartsImplementationError),
+    ([], errors.HighchartsImplementationError),
+    ('not-a-type', errors.HighchartsValueError),
+])
+def test_class_sensitive_types(types, error):
+    if not error:
+        decorator = class_sensitive(types = types)
+        assert decorator is not None
+    else:
+        with pytest.raises(error):
+            decorator = class_sensitive(types = types)
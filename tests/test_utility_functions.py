@@ -11,7 +11,7 @@ except ImportError:
 
 from validator_collection import checkers
 
-from highcharts_core import utility_functions, constants
+from highcharts_core import utility_functions, constants, errors
 
 
 @pytest.mark.parametrize('kwargs, expected_column_names, expected_records, error', [
@@ -46,6 +46,130 @@ def test_to_snake_case(camelCase, expected, error):
             result = utility_functions.to_snake_case(camelCase)
 
 
+@pytest.mark.parametrize('value, expected_type, error', [
+    (None, type(None), None),
+    ('#ffffff', str, None),
+    ('pattern-fill', str, None),
+    ({
+        'linearGradient': {'x1': 0, 'x2': 0, 'y1': 0, 'y2': 1},
+        'stops': [[0, '#003399'], [1, '#3366AA']]
+     }, 'Gradient', None),
+    ({
+        'linear_gradient': {'x1': 0, 'x2': 0, 'y1': 0, 'y2': 1},
+        'stops': [[0, '#003399'], [1, '#3366AA']]
+     }, 'Gradient', None),
+    ('{"linearGradient": {"x1": 0, "x2": 0, "y1": 0, "y2": 1}, "stops": [[0, "#003399"]]}',
+     'Gradient', None),
+    ({
+        'patternOptions': {'path': 'M 0 0 L 10 10', 'width': 10, 'height': 10}
+     }, 'Pattern', None),
+    ({
+        'pattern_options': {'path': 'M 0 0 L 10 10', 'width': 10, 'height': 10}
+     }, 'Pattern', None),
+
+    ({'not_a_color': 123}, None, ValueError),
+    (123, None, ValueError),
+])
+def test_validate_color(value, expected_type, error):
+    if not error:
+        result = utility_functions.validate_color(value)
+        if isinstance(expected_type, str):
+            assert checkers.is_type(result, expected_type) is True
+        else:
+            assert isinstance(result, expected_type) is True
+    else:
+        with pytest.raises(error):
+            result = utility_functions.validate_color(value)
+
+
+@pytest.mark.parametrize('value, kwargs, expected, error', [
+    (None, {}, None, None),
+    (5, {}, 5, None),
+    (2.5, {'minimum': 0}, 2.5, None),
+    (-3, {}, -3, None),
+    ('12', {}, 12.0, None),
+    (0, {'minimum': 0}, 0, None),
+
+    (-1, {'minimum': 0}, None, ValueError),
+    ('not-a-number', {}, None, (ValueError, TypeError)),
+])
+def test_validate_numeric(value, kwargs, expected, error):
+    if not error:
+        result = utility_functions.validate_numeric(value, **kwargs)
+        assert result == expected
+    else:
+        with pytest.raises(error):
+            result = utility_functions.validate_numeric(value, **kwargs)
+
+
+@pytest.mark.parametrize('value, kwargs, expected, error', [
+    (None, {}, None, None),
+    (5, {}, 5, None),
+    (1, {'minimum': 1}, 1, None),
+    ('3', {}, 3, None),
+    (2.7, {'minimum': 0, 'coerce_value': True}, 3, None),
+
+    (0, {'minimum': 1}, None, ValueError),
+    (2.5, {}, None, ValueError),
+])
+def test_validate_integer(value, kwargs, expected, error):
+    if not error:
+        result = utility_functions.validate_integer(value, **kwargs)
+        assert result == expected
+    else:
+        with pytest.raises(error):
+            result = utility_functions.validate_integer(value, **kwargs)
+
+
+@pytest.mark.parametrize('value, expected, error', [
+    (None, None, None),
+    ('', None, None),
+    ('some-class-name', 'some-class-name', None),
+
+    (123, None, (ValueError, TypeError)),
+])
+def test_validate_string(value, expected, error):
+    if not error:
+        result = utility_functions.validate_string(value)
+        assert result == expected
+    else:
+        with pytest.raises(error):
+            result = utility_functions.validate_string(value)
+
+
+@pytest.mark.parametrize('value, expected, error', [
+    (None, None, None),
+    ('', None, None),
+    ('left', 'left', None),
+    ('LEFT', 'left', None),
+
+    ('invalid', None, errors.HighchartsValueError),
+    (123, None, (ValueError, TypeError)),
+])
+def test_validate_enum(value, expected, error):
+    allowed = frozenset(['left', 'center', 'right'])
+    if not error:
+        result = utility_functions.validate_enum(value, allowed, 'align')
+        assert result == expected
+    else:
+        with pytest.raises(error):
+            result = utility_functions.validate_enum(value, allowed, 'align')
+
+
+@pytest.mark.parametrize('value, expected', [
+    (None, None),
+    (True, True),
+    (False, False),
+    (1, True),
+    (0, False),
+    ('', False),
+    ('yes', True),
+])
+def test_validate_bool(value, expected):
+    result = utility_functions.validate_bool(value)
+    assert result is expected
+
+
 if HAS_NUMPY:
     @pytest.mark.parametrize('value, expected_dtype, error', [
         ([1, 2, 3], [np.int32, np.int64], None),
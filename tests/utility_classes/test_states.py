@@ -5,6 +5,9 @@ import pytest
 from json.decoder import JSONDecodeError
 
 from highcharts_core.utility_classes.states import States as cls
+from highcharts_core.utility_classes.states import HoverState
+from highcharts_core.utility_classes.gradients import Gradient
+from highcharts_core.utility_classes.patterns import Pattern
 from highcharts_core import errors
 from tests.fixtures import input_files, check_input_file, to_camelCase, to_js_dict, \
     Class__init__, Class__to_untrimmed_dict, Class_from_dict, Class_to_dict, \
@@ -89,3 +92,30 @@ def test_to_dict(kwargs, error):
 ])
 def test_from_js_literal(input_files, filename, as_file, error):
     Class_from_js_literal(cls, input_files, filename, as_file, error)
+
+
+@pytest.mark.parametrize('as_dict, expected_type, expected_color', [
+    ({
+        'color': {
+            'linearGradient': {'x1': 0, 'x2': 0, 'y1': 0, 'y2': 1},
+            'stops': [[0, '#003399'], [1, '#3366AA']]
+        }
+    }, Gradient, {
+        'linearGradient': {'x1': 0, 'x2': 0, 'y1': 0, 'y2': 1},
+        'stops': [[0, '#003399'], [1, '#3366AA']]
+    }),
+    ({
+        'color': {
+            'patternOptions': {'path': 'M 0 0 L 10 10', 'width': 10, 'height': 10}
+        }
+    }, Pattern, {
+        'pattern': {'path': 'M 0 0 L 10 10', 'width': 10, 'height': 10}
+    }),
+    ({
+        'color': '#cccccc'
+    }, str, '#cccccc'),
+])
+def test_HoverState_color(as_dict, expected_type, expected_color):
+    result = HoverState.from_dict(as_dict)
+    assert isinstance(result.color, expected_type) is True
+    assert result.to_dict()['color'] == expected_color